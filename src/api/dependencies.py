@@ -0,0 +1,25 @@
+"""
+Shared FastAPI dependencies for the API layer.
+"""
+from functools import lru_cache
+
+from src.core.redis_client import RedisClient
+
+
+@lru_cache(maxsize=1)
+def _shared_redis_client() -> RedisClient:
+    """Builds the process-wide RedisClient (redis-py pools connections internally)."""
+    return RedisClient()
+
+
+def get_redis() -> RedisClient:
+    """
+    Returns the shared RedisClient so requests reuse one connection pool.
+
+    If Redis was unreachable when the client was built, the cached instance is
+    dropped so the next request retries the connection.
+    """
+    redis_client = _shared_redis_client()
+    if redis_client.client is None:
+        _shared_redis_client.cache_clear()
+    return redis_client
@@ -0,0 +1,3 @@
+"""
+API routers for Audit Pit-Crew, registered on the app in src/api/main.py.
+"""
@@ -0,0 +1,176 @@
+"""
+GitHub webhook endpoint.
+
+Verifies the webhook signature and dispatches scan tasks for relevant
+pull request events.
+"""
+import hmac
+import hashlib
+import re
+import ssl
+import logging
+from fastapi import APIRouter, Request, HTTPException, status, Header
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, ValidationError
+from typing import Optional
+from src.config import settings
+from src.worker.tasks import scan_repo_task
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["github"])
+
+# Webhook secret encoded once at import; verify_signature runs on every webhook.
+_SECRET_BYTES = settings.GITHUB_WEBHOOK_SECRET.encode('utf-8')
+_SIG_PREFIX = b"sha256="
+
+# Matches a clone URL wrapped as a markdown link: [url](url)
+_MD_LINK_RE = re.compile(r'^\[([^\]]+)\]\([^\)]+\)$')
+
+
+# --- Payload Models ---
+# Only the fields we read are declared; pydantic-core parses the JSON in Rust and
+# skips everything else, so large PR payloads are never materialized as a dict.
+
+class _Owner(BaseModel):
+    login: str
+
+class _Repository(BaseModel):
+    name: str
+    clone_url: str
+    owner: _Owner
+
+class _GitRef(BaseModel):
+    sha: str
+    ref: str
+
+class _PullRequest(BaseModel):
+    number: int
+    base: _GitRef
+    head: _GitRef
+
+class _Installation(BaseModel):
+    id: int
+
+class PullRequestEvent(BaseModel):
+    """The subset of a pull_request webhook payload needed to dispatch a scan."""
+    model_config = ConfigDict(extra='ignore')
+
+    action: Optional[str] = None
+    repository: Optional[_Repository] = None
+    pull_request: Optional[_PullRequest] = None
+    installation: Optional[_Installation] = None
+
+
+# Verifies GitHub's signature; called by the webhook once the event is known to be relevant
+async def verify_signature(request: Request):
+    """
+    Verifies the webhook signature against the secret.
+
+    The body is hashed incrementally while it is received, so only one copy of the
+    payload is held. The verified bytes are also stashed on `request.state.body`.
+    """
+    signature = request.headers.get("X-Hub-Signature-256")
+    
+    # ==================================================================
+    # 🛡️ LOCAL DEBUG BYPASS (Header-Based)
+    # Allows curl/manual requests without a signature header to pass.
+    # This works even if GITHUB_WEBHOOK_SECRET is set in .env.
+    # ==================================================================
+    if signature is None:
+        logger.warning("⚠️ Local Test: Signature header missing. Bypassing security check.")
+        body = await request.body()
+        request.state.body = body
+        return body
+    # ==================================================================
+
+    # Normal Security Logic
+    if not _SECRET_BYTES:
+         logger.error("❌ Webhook secret not configured.")
+         raise HTTPException(status_code=500, detail="Server misconfiguration")
+
+    hash_object = hmac.new(_SECRET_BYTES, digestmod='sha256')
+    body = bytearray()
+    async for chunk in request.stream():
+        hash_object.update(chunk)
+        body += chunk
+    expected_signature = _SIG_PREFIX + hash_object.hexdigest().encode('ascii')
+
+    # Starlette decodes header values as latin-1, so this round-trips the raw header bytes
+    if not hmac.compare_digest(expected_signature, signature.encode('latin-1')):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Signature mismatch")
+
+    request.state.body = body
+    return body
+
+def log_hash_backend():
+    """Logs whether webhook HMAC-SHA256 runs on OpenSSL (SHA-NI / ARMv8 SHA2 capable) or the builtin."""
+    backend = "OpenSSL" if hashlib.sha256.__module__ == "_hashlib" else "builtin"
+    logger.info(f"🔐 Webhook HMAC-SHA256 backend: {backend} ({ssl.OPENSSL_VERSION})")
+
+
+@router.post("/webhook/github")
+async def github_webhook(
+    request: Request,
+    x_github_event: Optional[str] = Header(None),
+):
+    """
+    Handles all incoming GitHub Webhook events.
+
+    Events other than pull_request are acknowledged with 204 before the body is
+    read, so the signature is only verified for payloads we act on.
+    """
+    # 1. Validation and Event Filtering
+    if x_github_event != "pull_request":
+        logger.info(f"Skipping webhook event: {x_github_event}")
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    body = await verify_signature(request)
+    try:
+        event = PullRequestEvent.model_validate_json(body)
+    except ValidationError as e:
+        logger.error(f"Invalid GitHub payload: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid webhook payload: {e.error_count()} validation error(s)")
+    action = event.action
+
+    # Process only relevant PR actions
+    if action not in ["opened", "reopened", "synchronize"]:
+        logger.info(f"Skipping pull_request action: {action}")
+        return {"message": f"PR action '{action}' received but skipped."}
+
+    for field_name in ("repository", "pull_request", "installation"):
+        if getattr(event, field_name) is None:
+            logger.error(f"Missing required field in GitHub payload: '{field_name}'")
+            raise HTTPException(status_code=400, detail=f"Invalid webhook payload: Missing key '{field_name}'")
+
+    try:
+        # 2. Extract Context
+        pull_request = event.pull_request
+        pr_context = {
+            "owner": event.repository.owner.login,
+            "repo": event.repository.name,
+            "pr_number": pull_request.number,
+            "base_sha": pull_request.base.sha,
+            "head_sha": pull_request.head.sha,
+            "base_ref": pull_request.base.ref,
+            "head_ref": pull_request.head.ref,
+            "installation_id": event.installation.id
+        }
+
+        repo_url = event.repository.clone_url
+        # Remove markdown formatting if present (defensive; skips the regex on the common path)
+        if repo_url.startswith('['):
+            repo_url = _MD_LINK_RE.sub(r'\1', repo_url)
+
+        # 3. Dispatch Celery Task
+        task_id = scan_repo_task.delay(repo_url, pr_context)
+        logger.info(f"Received PR #{pr_context['pr_number']}. Task dispatched: {task_id}")
+
+        return {
+            "message": "Webhook received and task dispatched.", 
+            "task_id": str(task_id)
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to process webhook: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error during task dispatch.")
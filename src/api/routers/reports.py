@@ -0,0 +1,177 @@
+"""
+Report endpoints.
+
+Serves the Pre-Audit Clearance Certificate PDF and JSON scan summaries
+from the latest scan result stored in Redis.
+"""
+import io
+import logging
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any
+from src.core.redis_client import RedisClient
+from src.api.dependencies import get_redis
+from src.core.reports.pdf_generator import (
+    PreAuditReportGenerator, ReportData, IssuesSummary, count_issue_severities
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+# Chunk size used when streaming generated PDFs to the client
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+def _get_severity_counts(scan_result: Dict[str, Any]) -> Dict[str, int]:
+    """Returns the severity counts stored with the scan result, counting only for older results."""
+    severity_counts = scan_result.get("severity_counts")
+    if severity_counts:
+        return dict(severity_counts)
+    return count_issue_severities(scan_result.get("issues", []))
+
+async def _iter_buffer(buffer: io.BytesIO):
+    """Yields a buffer's contents in fixed-size chunks and closes it when drained."""
+    try:
+        while chunk := buffer.read(PDF_STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        buffer.close()
+
+
+@router.get("/{owner}/{repo}/pdf")
+async def get_pre_audit_pdf(owner: str, repo: str, redis_client: RedisClient = Depends(get_redis)):
+    """
+    Generate and download a Pre-Audit Clearance Certificate PDF.
+    
+    Retrieves the latest scan results for the repository and generates
+    a professional PDF report suitable for sharing with investors.
+    
+    Args:
+        owner: Repository owner/organization name
+        repo: Repository name
+        
+    Returns:
+        PDF file as downloadable response
+        
+    Raises:
+        404: No scan results found for this repository
+        500: PDF generation failed
+    """
+    logger.info(f"📄 PDF report requested for {owner}/{repo}")
+    
+    # Retrieve scan results from Redis
+    scan_result = await run_in_threadpool(redis_client.get_scan_result, owner, repo)
+    
+    if not scan_result:
+        logger.warning(f"⚠️ No scan results found for {owner}/{repo}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"No scan results found for {owner}/{repo}. Run a security scan first."
+        )
+    
+    try:
+        # Parse issues and count by severity
+        issues = scan_result.get("issues", [])
+        issues_summary = IssuesSummary(**_get_severity_counts(scan_result))
+        
+        # Parse scan date
+        saved_at = scan_result.get("saved_at", datetime.utcnow().isoformat())
+        try:
+            scan_date = datetime.fromisoformat(saved_at.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            scan_date = datetime.utcnow()
+        
+        # Build report data
+        report_data = ReportData(
+            repo_owner=owner,
+            repo_name=repo,
+            scan_date=scan_date,
+            commit_sha=scan_result.get("commit_sha", "unknown"),
+            branch=scan_result.get("branch", "main"),
+            tools_used=scan_result.get("tools_used", ["Slither", "Mythril"]),
+            issues_summary=issues_summary,
+            issues=issues,
+            files_scanned=scan_result.get("files_scanned", 0),
+        )
+        
+        # Generate PDF into a single buffer that is streamed back in chunks.
+        # ReportLab rendering is CPU-bound, so keep it off the event loop.
+        generator = PreAuditReportGenerator()
+        pdf_buffer = io.BytesIO()
+        await run_in_threadpool(generator.generate_to, report_data, pdf_buffer)
+        pdf_size = pdf_buffer.tell()
+        pdf_buffer.seek(0)
+        
+        # Generate filename
+        date_str = scan_date.strftime("%Y%m%d")
+        filename = f"{owner}_{repo}_pre_audit_certificate_{date_str}.pdf"
+        
+        logger.info(f"✅ Generated PDF report for {owner}/{repo}: {pdf_size} bytes")
+        
+        return StreamingResponse(
+            _iter_buffer(pdf_buffer),
+            media_type="application/pdf",
+            headers={
+                "Content-Length": str(pdf_size),
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "X-Scan-Date": saved_at,
+                "X-Issues-Total": str(issues_summary.total),
+                "X-Clearance-Status": "PASSED" if issues_summary.blocking == 0 else "FAILED",
+            }
+        )
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to generate PDF report: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to generate PDF report: {str(e)}"
+        )
+
+
+@router.get("/{owner}/{repo}/summary")
+async def get_scan_summary(owner: str, repo: str, redis_client: RedisClient = Depends(get_redis)):
+    """
+    Get a summary of the latest scan results for a repository.
+    
+    This endpoint returns JSON summary data that can be used to display
+    scan status in dashboards or check if PDF generation is available.
+    
+    Args:
+        owner: Repository owner/organization name
+        repo: Repository name
+        
+    Returns:
+        JSON summary of scan results
+    """
+    scan_result = await run_in_threadpool(redis_client.get_scan_result, owner, repo)
+    
+    if not scan_result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No scan results found for {owner}/{repo}."
+        )
+    
+    # Count issues by severity
+    issues = scan_result.get("issues", [])
+    severity_counts = _get_severity_counts(scan_result)
+    
+    blocking_count = severity_counts["critical"] + severity_counts["high"]
+    
+    return {
+        "repository": f"{owner}/{repo}",
+        "scan_date": scan_result.get("saved_at"),
+        "scan_type": scan_result.get("scan_type", "unknown"),
+        "branch": scan_result.get("branch", "unknown"),
+        "commit_sha": scan_result.get("commit_sha", "unknown"),
+        "tools_used": scan_result.get("tools_used", []),
+        "files_scanned": scan_result.get("files_scanned", 0),
+        "issues": {
+            "total": len(issues),
+            "by_severity": severity_counts,
+            "blocking": blocking_count,
+        },
+        "clearance_status": "PASSED" if blocking_count == 0 else "FAILED",
+        "pdf_available": True,
+    }
@@ -1,4 +1,7 @@
 import os
+from functools import cached_property
+from pathlib import Path
+from cryptography.hazmat.primitives import serialization
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -18,7 +21,7 @@ class Settings(BaseSettings):
     # GitHub Config
     GITHUB_APP_ID: str
     # This expects the file path to the .pem key
-    GITHUB_PRIVATE_KEY_PATH: str 
+    GITHUB_PRIVATE_KEY_PATH: Path
     GITHUB_WEBHOOK_SECRET: str
     
     # Worker Config
@@ -28,5 +31,15 @@ class Settings(BaseSettings):
     # Security: Default scan timeout
     MAX_SCAN_TIME_SECONDS: int = 300
 
+    @cached_property
+    def github_private_key(self) -> bytes:
+        """PEM contents of the GitHub App private key, read from disk once per process."""
+        return self.GITHUB_PRIVATE_KEY_PATH.read_bytes()
+
+    @cached_property
+    def github_signing_key(self):
+        """Deserialized RSA key, so RS256 signing skips PEM parsing on every JWT."""
+        return serialization.load_pem_private_key(self.github_private_key, password=None)
+
 # Create a global settings object
 settings = Settings()
@@ -1,10 +1,14 @@
-import subprocess
-import json
 import os
+import shutil
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TYPE_CHECKING
 
-from src.core.analysis.base_scanner import BaseScanner, AderynExecutionError
+import ijson
+import orjson
+
+from src.core.tools.run_tool import is_blank, looks_like_json, run_tool
+from src.core.analysis.base_scanner import BaseScanner, Issue, AderynExecutionError, expand_severity_keys
 
 if TYPE_CHECKING:
     from src.core.config import AuditConfig
@@ -12,6 +16,13 @@ if TYPE_CHECKING:
 # Configure a logger for this module
 logger = logging.getLogger(__name__)
 
+ADERYN_BIN = shutil.which("aderyn")
+
+# Report files larger than this are streamed issue by issue instead of loaded whole.
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+# Chunk size for streamed reports; ijson's 64 KiB default costs a read syscall per chunk
+STREAM_READ_BYTES = 1024 * 1024
+
 
 class AderynScanner(BaseScanner):
     """
@@ -31,77 +42,79 @@ class AderynScanner(BaseScanner):
         'informational': 'Low',
     }
 
-    import json
-import os
-import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
-
-from src.core.tools.run_tool import run_tool
-from src.core.analysis.base_scanner import BaseScanner, AderynExecutionError
+    SEVERITY_LOOKUP = expand_severity_keys(SEVERITY_MAP)
 
-if TYPE_CHECKING:
-    from src.core.config import AuditConfig
-
-# Configure a logger for this module
-logger = logging.getLogger(__name__)
+    # Standard severities produced by SEVERITY_MAP, most severe first
+    SEVERITY_ORDER = ('Critical', 'High', 'Medium', 'Low')
 
+    @staticmethod
+    def _parse_stdout_issues(stdout: bytes) -> List[Dict[str, Any]]:
+        """
+        Parses Aderyn's JSON report from stdout and returns its "issues" array. Reports
+        normally arrive through the -o file; stdout only carries small ones.
 
-class AderynScanner(BaseScanner):
-    """
-    Wraps the Aderyn CLI tool to scan Solidity contracts for security vulnerabilities.
-    Aderyn performs directory-level analysis and outputs a comprehensive JSON report.
-    """
-
-    TOOL_NAME = "Aderyn"
-
-    # Severity mapping from Aderyn's native severity levels to standard system levels
-    SEVERITY_MAP = {
-        'critical': 'Critical',
-        'high': 'High',
-        'medium': 'Medium',
-        'low': 'Low',
-        'info': 'Low',
-        'informational': 'Low',
-    }
+        Raises:
+            ValueError: If stdout is not valid JSON
+        """
+        doc = orjson.loads(stdout)
+        issues = doc.get("issues") if isinstance(doc, dict) else None
+        return issues or []
 
-    def _execute_aderyn(self, target_path: str) -> Dict[str, Any]:
+    def _stream_report_issues(self, output_filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields raw issues from a large Aderyn report file without
+        materializing the whole document.
+        """
+        try:
+            # Unbuffered: ijson already reads in STREAM_READ_BYTES chunks, so a Python-level
+            # buffer would only add a copy
+            with open(output_filepath, 'rb', buffering=0) as f:
+                yield from ijson.items(f, 'issues.item', use_float=True, buf_size=STREAM_READ_BYTES)
+        except ijson.JSONError as e:
+            logger.warning(f"⚠️ Aderyn output file is not valid JSON: {e}")
+            raise AderynExecutionError(f"Aderyn Scan Failed. Output file not valid JSON: {e}")
+
+    def _execute_aderyn(self, target_path: str) -> Iterable[Dict[str, Any]]:
         """
         Executes the Aderyn CLI tool against the entire target directory.
-        Returns the JSON output from Aderyn.
+        Returns the raw issues from Aderyn's JSON output.
 
         Args:
             target_path: Path to the repository root to scan
 
         Returns:
-            Dictionary containing Aderyn's JSON output
+            Iterable of raw Aderyn issues (a lazy stream for large report files)
 
         Raises:
             AderynExecutionError: If the command fails or returns invalid output
         """
+        if ADERYN_BIN is None:
+            raise AderynExecutionError("Aderyn executable not found on PATH.")
+
         # Create a temporary output file path
         output_filename = "aderyn_report.json"
         output_filepath = os.path.join(target_path, output_filename)
 
         # Construct the command
         # Aderyn expects the output file path with -o, not just the format
-        cmd = ["aderyn", target_path, "-o", output_filename]
+        cmd = [ADERYN_BIN, target_path, "-o", output_filename]
 
-        logger.info(f"Executing Aderyn command: {' '.join(cmd)}")
-        logger.info(f"Working directory (cwd): {target_path}")
+        logger.info("Executing Aderyn command: %s", cmd)
+        logger.info("Working directory (cwd): %s", target_path)
 
         rc, stdout, stderr, out_path, err_path = run_tool(cmd, cwd=target_path, timeout=600)
 
         logger.info(f"Aderyn stdout log: {out_path}")
         logger.info(f"Aderyn stderr log: {err_path}")
 
-        if not stdout.strip():
-            stderr_str = stderr.decode('utf-8', errors='ignore')
-            if stderr_str.strip():
+        if is_blank(stdout):
+            if not is_blank(stderr):
+                stderr_str = stderr.decode('utf-8', errors='ignore')
                 logger.error(f"tool_error: Aderyn stdout was empty, but stderr contained: {stderr_str}")
                 raise AderynExecutionError(f"Aderyn Scan Failed. Stderr: {stderr_str}")
             else:
                 logger.info("tool_no_output: Aderyn stdout and stderr were empty. No issues found.")
-                return {"issues": []}
+                return []
 
         if rc != 0:
             stderr_str = stderr.decode('utf-8', errors='ignore')
@@ -110,38 +123,48 @@ class AderynScanner(BaseScanner):
                 logger.error(f"Aderyn stderr: {stderr_str}")
             raise AderynExecutionError(f"Aderyn tool failed with exit code {rc}. Details: {stderr_str}")
 
-        if stdout.strip():
+        # stdout stays bytes all the way into the parser; it is only decoded for debug output.
+        # Output that cannot start a JSON document skips the parse attempt entirely.
+        if looks_like_json(stdout):
             try:
-                json_output = json.loads(stdout)
+                issues = self._parse_stdout_issues(stdout)
                 logger.info("✅ Aderyn analysis finished. JSON output received.")
-                return json_output
-            except json.JSONDecodeError as e:
+                return issues
+            except ValueError as e:
                 logger.warning(f"⚠️ Aderyn stdout is not valid JSON: {e}")
-                logger.debug(f"Aderyn stdout: {stdout.decode('utf-8', errors='ignore')[:500]}")
-
-        # If no JSON output in stdout, check if file was created
-        if os.path.exists(output_filepath):
-            try:
-                with open(output_filepath, 'r') as f:
-                    json_output = json.load(f)
-                logger.info("✅ Aderyn analysis finished. JSON output read from file.")
-                return json_output
-            except json.JSONDecodeError as e:
-                stderr_str = stderr.decode('utf-8', errors='ignore')
-                logger.warning(f"⚠️ Aderyn output file is not valid JSON: {e}")
-                raise AderynExecutionError(f"Aderyn Scan Failed. Output file not valid JSON. Stderr: {stderr_str}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Aderyn stdout: {stdout[:500].decode('utf-8', errors='ignore')}")
+        else:
+            logger.debug("Aderyn stdout is not JSON; checking the report file.")
+
+        # If no JSON output in stdout, check if file was created. A single open (sized with
+        # fstat) replaces exists + getsize + open, so there is no window between the checks
+        try:
+            with open(output_filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size <= STREAM_THRESHOLD_BYTES:
+                    json_output = orjson.loads(f.read())
+                    logger.info("✅ Aderyn analysis finished. JSON output read from file.")
+                    return json_output.get("issues", [])
+            logger.info("✅ Aderyn analysis finished. Streaming JSON output from file.")
+            return self._stream_report_issues(output_filepath)
+        except FileNotFoundError:
+            pass
+        except orjson.JSONDecodeError as e:
+            stderr_str = stderr.decode('utf-8', errors='ignore')
+            logger.warning(f"⚠️ Aderyn output file is not valid JSON: {e}")
+            raise AderynExecutionError(f"Aderyn Scan Failed. Output file not valid JSON. Stderr: {stderr_str}")
 
         # If we got here and rc==0 but no output, it might mean no issues or stdout was empty
         if rc == 0:
              logger.info("Aderyn analysis completed with no JSON output (likely no issues found).")
-             return {"issues": []}
+             return []
         
         stderr_str = stderr.decode('utf-8', errors='ignore')
         raise AderynExecutionError(f"Aderyn Scan Failed. No output file created and no stdout. Stderr: {stderr_str}")
 
 
 
-    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> List[Dict[str, Any]]:
+    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> List[Issue]:
         """
         Runs Aderyn on the target directory.
 
@@ -151,51 +174,83 @@ class AderynScanner(BaseScanner):
             config: Optional AuditConfig object containing filtering rules (min_severity)
 
         Returns:
-            List of standardized issue dictionaries
+            List of standardized issues
         """
         logger.info("🔍 Starting Aderyn scan on: {}".format(target_path))
 
         if files:
             logger.info(f"📌 Note: Aderyn scans entire directory. Individual file filtering is not applied.")
 
-        json_output = self._execute_aderyn(target_path)
+        # Aderyn returns issues in a top-level "issues" array; large reports arrive as a stream
+        issues = self._execute_aderyn(target_path)
+
+        # Issues are bucketed by severity as they are converted, so filtering is a slice
+        # of the buckets rather than a second pass over every issue
+        buckets: Dict[str, List[Issue]] = {severity: [] for severity in self.SEVERITY_ORDER}
+
+        # Bind hot lookups to locals; this loop runs once per finding
+        severity_lookup = self.SEVERITY_LOOKUP
+        severity_map = self.SEVERITY_MAP
+        tool = self.TOOL_NAME
+        raw_data = self._raw_data_converter(config)
+        isabs = os.path.isabs
+        relpath = os.path.relpath
 
-        all_issues: List[Dict[str, Any]] = []
+        # Aderyn reports absolute paths under the scanned root; stripping that prefix
+        # avoids relpath's abspath normalization of both arguments on every issue
+        target_prefix = os.path.abspath(target_path).rstrip(os.sep) + os.sep
+        prefix_len = len(target_prefix)
 
-        # Parse Aderyn output and convert to standard format
-        # Aderyn returns issues in a top-level "issues" array
-        issues = json_output.get("issues", [])
+        # Aderyn can repeat a finding (e.g. once per function); keep the first of each
+        # (type, file, line), matching the fingerprint used downstream for this tool
+        seen: set = set()
 
+        # Convert Aderyn output to standard format
         for raw_issue in issues:
-            # Extract file path and make it relative to target_path
-            file_path = raw_issue.get('file', '')
-
-            # Ensure file path is relative to target_path
-            if os.path.isabs(file_path):
-                file_path = os.path.relpath(file_path, target_path)
-
-            # Convert Aderyn's format to standard issue dictionary
-            issue = {
-                'type': raw_issue.get('title', raw_issue.get('name', 'Unknown')),
-                'severity': self.SEVERITY_MAP.get(
-                    raw_issue.get('severity', 'low').lower(),
-                    'Low'
-                ),
-                'confidence': raw_issue.get('confidence', 'Unknown'),
-                'description': raw_issue.get('description', ''),
-                'file': file_path,
-                'line': raw_issue.get('line', 0),
-                'tool': self.TOOL_NAME,
-                'raw_data': raw_issue,
-            }
-            all_issues.append(issue)
+            get = raw_issue.get
+
+            # Extract file path and ensure it is relative to target_path
+            file_path = get('file', '')
+            if file_path.startswith(target_prefix):
+                file_path = file_path[prefix_len:]
+            elif isabs(file_path):
+                file_path = relpath(file_path, target_path)
+
+            issue_type = get('title', get('name', 'Unknown'))
+            line = get('line', 0)
+            key = (issue_type, file_path, line)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            raw_severity = get('severity', 'low')
+            severity = severity_lookup.get(raw_severity) or severity_map.get(raw_severity.lower(), 'Low')
+
+            # Convert Aderyn's format to a standard issue
+            buckets[severity].append(Issue(
+                tool=tool,
+                type=issue_type,
+                severity=severity,
+                confidence=get('confidence', 'Unknown'),
+                description=get('description', ''),
+                file=file_path,
+                line=line,
+                raw_data=raw_data(raw_issue),
+            ))
 
         # Apply severity filtering
         min_severity = 'Low'
         if config and hasattr(config, 'scan') and hasattr(config.scan, 'min_severity'):
             min_severity = config.scan.min_severity
+        elif config and hasattr(config, 'min_severity'):
+            # UnifiedScanner passes the ScanConfig directly
+            min_severity = config.min_severity
 
         logger.debug(f"🎯 Aderyn: Filtering issues with minimum severity: {min_severity}")
-        filtered_issues = self._filter_by_severity(all_issues, min_severity)
+        # Unknown thresholds default to Low, which keeps every bucket
+        min_severity = min_severity.capitalize()
+        if min_severity not in self.SEVERITY_ORDER:
+            min_severity = 'Low'
+        kept = self.SEVERITY_ORDER[:self.SEVERITY_ORDER.index(min_severity) + 1]
 
-        return filtered_issues
+        return list(chain.from_iterable(buckets[severity] for severity in kept))
@@ -1,13 +1,140 @@
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING, Tuple
+import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Callable, Iterator, Optional, TYPE_CHECKING, Tuple
 from abc import ABC, abstractmethod
 
+import orjson
+
 if TYPE_CHECKING:
     from src.core.config import AuditConfig
 
 # Configure a logger for this module
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class Issue(Mapping):
+    """
+    A standardized scanner finding.
+
+    Stored in slots rather than a per-instance dict, which roughly halves the memory
+    of each issue. Implements the read-only Mapping protocol so consumers written
+    against plain issue dicts (issue['type'], issue.get(...), dict(issue)) keep working,
+    and orjson serializes it natively.
+    """
+    tool: str
+    type: str
+    severity: str
+    confidence: str
+    description: str
+    file: str
+    line: int
+    function: str = 'Unknown'
+    swc_id: str = ''
+    # The tool's original finding, only kept when keep_raw_issues (or KEEP_RAW) is set
+    raw_data: Any = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ISSUE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ISSUE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_ISSUE_FIELDS)
+
+
+_ISSUE_FIELDS = tuple(f.name for f in fields(Issue))
+
+
+def expand_severity_keys(severity_map: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a copy of a lowercase-keyed severity mapping that also contains the
+    capitalized and upper-case spelling of every key. Tools emit severities in all
+    three forms, so lookups on the expanded map rarely need a .lower() call.
+    """
+    return {
+        spelling: value
+        for key, value in severity_map.items()
+        for spelling in (key, key.capitalize(), key.upper())
+    }
+
+
+def relative_paths(target_path: str, paths: List[str]) -> List[str]:
+    """
+    Returns paths relative to target_path. Changed files arrive as paths joined onto the
+    repository root, so slicing off that prefix skips relpath's normalization of both
+    arguments for each file; other paths still go through os.path.relpath.
+    """
+    target_prefix = os.path.abspath(target_path).rstrip(os.sep) + os.sep
+    prefix_len = len(target_prefix)
+    return [
+        p[prefix_len:] if p.startswith(target_prefix) else os.path.relpath(p, target_path)
+        for p in paths
+    ]
+
+
+# Quoted path of a Solidity import directive, in any of its forms
+_IMPORT_PATH = re.compile(rb'^\s*import\b[^"\';]*["\']([^"\']+)["\']', re.MULTILINE)
+
+# Roots, relative to the repository, that non-relative imports are resolved against
+_IMPORT_ROOTS = ("", "node_modules", "lib")
+
+
+def _resolve_import(target_path: str, importer_dir: str, import_path: str) -> Optional[str]:
+    """Returns the repository-relative path an import refers to, or None if not found."""
+    if import_path.startswith(('./', '../')):
+        candidates = [os.path.normpath(os.path.join(importer_dir, import_path))]
+    else:
+        candidates = [os.path.normpath(os.path.join(root, import_path)) for root in _IMPORT_ROOTS]
+    for candidate in candidates:
+        if not candidate.startswith('..') and os.path.isfile(os.path.join(target_path, candidate)):
+            return candidate
+    return None
+
+
+def source_closure_digest(target_path: str, file_path: str, include_root_path: bool = True) -> Optional[str]:
+    """
+    Digest of a contract and every source it transitively imports, since a tool's
+    findings for a file depend on the code it inherits from and calls into.
+
+    With include_root_path=False the scanned file contributes only its content, so
+    byte-identical contracts importing the same sources share a digest.
+
+    Returns None if an import cannot be resolved (e.g. it relies on remappings), so the
+    file is analyzed without a cache rather than matched against a stale entry.
+    """
+    root_path = os.path.normpath(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    pending = [root_path]
+    visited = set(pending)
+    while pending:
+        rel_path = pending.pop()
+        with open(os.path.join(target_path, rel_path), 'rb') as f:
+            source = f.read()
+        if include_root_path or rel_path != root_path:
+            digest.update(rel_path.encode() + b'\0')
+        digest.update(hashlib.blake2b(source, digest_size=16).digest())
+        importer_dir = os.path.dirname(rel_path)
+        for match in _IMPORT_PATH.finditer(source):
+            import_path = match.group(1).decode('utf-8', errors='replace')
+            resolved = _resolve_import(target_path, importer_dir, import_path)
+            if resolved is None:
+                return None
+            if resolved not in visited:
+                visited.add(resolved)
+                pending.append(resolved)
+    return digest.hexdigest()
+
+
 # Custom exceptions for tool failures
 class ToolExecutionError(Exception):
     """Base exception for tool execution failures."""
@@ -30,6 +157,21 @@ class AderynExecutionError(ToolExecutionError):
     pass
 
 
+@functools.lru_cache(maxsize=8192)
+def _fingerprint(tool: Any, issue_type: Any, file_path: Any, line: Any) -> str:
+    # Tools report the same detector on many lines and UnifiedScanner re-fingerprints
+    # across runs, so repeated keys are served from the cache instead of re-formatted
+    return f"{tool}|{issue_type}|{file_path}|{line}"
+
+
+def _raw_data_fragment(raw_issue: Any) -> orjson.Fragment:
+    return orjson.Fragment(orjson.dumps(raw_issue))
+
+
+def _discard_raw_data(raw_issue: Any) -> None:
+    return None
+
+
 class BaseScanner(ABC):
     """
     Abstract base class for security analysis tools.
@@ -46,6 +188,16 @@ class BaseScanner(ABC):
         'critical': 4,
     }
 
+    # SEVERITY_MAP ranks under the native, Capitalized and UPPER spellings. Kept separately
+    # because scanners may override SEVERITY_MAP with their own label normalization.
+    SEVERITY_RANKS = expand_severity_keys(SEVERITY_MAP)
+
+    # Whether emitted issues always carry the tool's raw finding, regardless of the
+    # keep_raw_issues config setting. Nothing downstream reads it, so it is dropped by
+    # default; when kept it is held as pre-serialized JSON bytes rather than a tree of
+    # live Python objects.
+    KEEP_RAW = False
+
     @abstractmethod
     def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
         """
@@ -63,6 +215,29 @@ class BaseScanner(ABC):
         """
         pass
 
+    async def run_async(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None):
+        """
+        Runs the scanner in the default thread executor so async callers are not blocked
+        for the duration of the tool subprocess and the output parsing.
+
+        Takes the same arguments and returns the same result as run().
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, target_path, files=files, config=config)
+        )
+
+    def _raw_data_converter(self, config=None) -> Callable[[Any], Any]:
+        """
+        Returns the function that turns a raw tool finding into Issue.raw_data. Unless
+        keep_raw_issues is set on the ScanConfig (or AuditConfig.scan), or KEEP_RAW on
+        the scanner, it discards the finding; otherwise it returns an orjson.Fragment
+        that is written verbatim when the issue is serialized (e.g. to Redis).
+        """
+        scan_config = getattr(config, 'scan', config)
+        if self.KEEP_RAW or getattr(scan_config, 'keep_raw_issues', False):
+            return _raw_data_fragment
+        return _discard_raw_data
 
     @staticmethod
     def get_issue_fingerprint(issue: Dict[str, Any]) -> str:
@@ -74,44 +249,64 @@ class BaseScanner(ABC):
         file_path = issue.get('file', 'unknown-file')
         line = issue.get('line', 0)
         tool = issue.get('tool', 'unknown-tool')
-        return f"{tool}|{issue_type}|{file_path}|{line}"
+        try:
+            return _fingerprint(tool, issue_type, file_path, line)
+        except TypeError:
+            # Unhashable field values (e.g. a list of lines) skip the cache
+            return f"{tool}|{issue_type}|{file_path}|{line}"
+
+    @classmethod
+    def reset_fingerprint_cache(cls) -> None:
+        """Clears the fingerprint cache, e.g. between jobs in a long-running worker."""
+        _fingerprint.cache_clear()
 
     @staticmethod
     def diff_issues(current_issues: List[Dict[str, Any]], baseline_issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Compares current issues against a baseline and returns only the new issues.
         """
-        baseline_fingerprints = {BaseScanner.get_issue_fingerprint(issue) for issue in baseline_issues}
+        # Same fields and defaults as get_issue_fingerprint, but as inline tuple keys:
+        # they hash faster than formatted strings and skip a call per issue
+        baseline_keys = {
+            (i.get('tool', 'unknown-tool'), i.get('type', 'unknown-type'), i.get('file', 'unknown-file'), i.get('line', 0))
+            for i in baseline_issues
+        }
         new_issues = [
-            issue for issue in current_issues 
-            if BaseScanner.get_issue_fingerprint(issue) not in baseline_fingerprints
+            i for i in current_issues
+            if (i.get('tool', 'unknown-tool'), i.get('type', 'unknown-type'), i.get('file', 'unknown-file'), i.get('line', 0))
+            not in baseline_keys
         ]
         return new_issues
 
-    def _filter_by_severity(self, issues: List[Dict[str, Any]], min_severity: str) -> List[Dict[str, Any]]:
+    def _severity_threshold(self, min_severity: str) -> int:
+        """
+        Resolves a minimum severity name (any casing) to its rank, defaulting to Low.
+        Scanners call this once per run and pass the result to _filter_by_severity.
+        """
+        return self.SEVERITY_RANKS.get(min_severity.lower(), 1)
+
+    def _filter_by_severity(self, issues: List[Dict[str, Any]], threshold: int) -> List[Dict[str, Any]]:
         """
         Filter issues to only include those meeting or exceeding the minimum severity threshold.
         
         Args:
             issues: List of issue dictionaries
-            min_severity: Minimum severity level (Low, Medium, High, Critical)
+            threshold: Minimum severity rank, as returned by _severity_threshold()
             
         Returns:
             Filtered list of issues
         """
-        # Default minimum severity is 'Low' -> rank 1
-        min_severity_level = self.SEVERITY_MAP.get(min_severity.lower(), 1)
-        filtered_issues = []
-
-        for issue in issues:
-            severity = issue.get('severity', 'Informational')
-            severity_level = self.SEVERITY_MAP.get(severity.lower(), 1)
-
-            # Skip issues below the minimum severity threshold
-            if severity_level < min_severity_level:
-                logger.debug(f"Filtering out {severity} issue: {issue.get('type', 'Unknown')}")
-                continue
+        # Common spellings hit the expanded map directly; only odd casings pay for .lower()
+        ranks = self.SEVERITY_RANKS
+        filtered_issues = [
+            issue for issue in issues
+            if (
+                ranks[severity] if (severity := issue.get('severity', 'Informational')) in ranks
+                else ranks.get(severity.lower(), 1)
+            ) >= threshold
+        ]
 
-            filtered_issues.append(issue)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Filtered out {len(issues) - len(filtered_issues)} issue(s) below rank {threshold}")
 
         return filtered_issues
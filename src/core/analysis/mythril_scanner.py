@@ -1,10 +1,16 @@
-import json
 import os
+import shutil
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from typing import List, Dict, Any, Callable, Optional, TYPE_CHECKING
 
-from src.core.tools.run_tool import run_tool
-from src.core.analysis.base_scanner import BaseScanner, MythrilExecutionError
+import orjson
+
+from src.core.tools import disk_cache
+from src.core.tools.run_tool import is_blank, looks_like_json, run_tool
+from src.core.analysis.base_scanner import BaseScanner, Issue, MythrilExecutionError, relative_paths, source_closure_digest
 
 if TYPE_CHECKING:
     from src.core.config import AuditConfig
@@ -16,6 +22,25 @@ logger = logging.getLogger(__name__)
 # This helps avoid "Connection reset by peer" errors when solcx tries to fetch version list
 os.environ.setdefault('SOLCX_BINARY_PATH_PREFIX', '/root/.solcx')
 
+# Resolved once per process so each scan skips the PATH search and fails fast if missing
+MYTH_BIN = shutil.which("myth")
+
+# Common flags for every analysis (--max-depth 3 for better vulnerability detection)
+# Higher depth = more thorough analysis but slower execution
+# --max-depth 3 = ~30 seconds per scan (good balance)
+MYTHRIL_FLAGS = ("--max-depth", "3", "-o", "json")
+
+# Per-file Mythril output keyed by the file, the sources it imports, the Mythril version,
+# the solc binary and the flags, so re-auditing unchanged contracts skips symbolic execution
+MYTHRIL_CACHE_DIR = os.environ.get(
+    "MYTHRIL_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "audit-pit-crew", "mythril")
+)
+
+try:
+    _MYTHRIL_VERSION = metadata.version("mythril")
+except metadata.PackageNotFoundError:
+    _MYTHRIL_VERSION = "unknown"
+
 
 class MythrilScanner(BaseScanner):
     """
@@ -24,18 +49,25 @@ class MythrilScanner(BaseScanner):
 
     TOOL_NAME = "Mythril"
 
+    # Mythril severities we keep as-is; anything else is reported as Informational
+    MYTHRIL_SEVERITY = {
+        'High': 'High',
+        'Medium': 'Medium',
+        'Low': 'Low',
+    }
+
     def _execute_mythril(self, target_path: str, relative_files: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Executes the mythril command and returns the JSON output.
         Raises MythrilExecutionError on failure.
         
-        Returns a dict with 'issues' list and 'scanned_files' for file attribution.
+        Returns a dict with 'issues' and 'scanned_files' for file attribution.
         """
-        output_filename = "mythril_report.json"
-        output_filepath = os.path.join(target_path, output_filename)
+        if MYTH_BIN is None:
+            raise MythrilExecutionError("Mythril executable (myth) not found on PATH.")
 
         # --- Command Construction ---
-        cmd = ["myth", "analyze"]
+        cmd = [MYTH_BIN, "analyze"]
 
         # Track which files we're scanning for file attribution
         scanned_files = []
@@ -50,21 +82,18 @@ class MythrilScanner(BaseScanner):
             logger.info("⚙️ Mythril: Running full scan on repository root.")
             cmd.append(".")
 
-        # Append common flags (--max-depth 3 for better vulnerability detection)
-        # Higher depth = more thorough analysis but slower execution
-        # --max-depth 3 = ~30 seconds per scan (good balance)
-        cmd.extend(["--max-depth", "3", "-o", "json"])
+        cmd.extend(MYTHRIL_FLAGS)
 
-        logger.info(f"Executing Mythril command: {' '.join(cmd)}")
+        logger.info("Executing Mythril command: %s", cmd)
 
         rc, stdout, stderr, out_path, err_path = run_tool(cmd, cwd=target_path, timeout=300)
 
         logger.info(f"Mythril stdout log: {out_path}")
         logger.info(f"Mythril stderr log: {err_path}")
 
-        if not stdout.strip():
-            stderr_str = stderr.decode('utf-8', errors='ignore')
-            if stderr_str.strip():
+        if is_blank(stdout):
+            if not is_blank(stderr):
+                stderr_str = stderr.decode('utf-8', errors='ignore')
                 logger.error(f"tool_error: Mythril stdout was empty, but stderr contained: {stderr_str}")
                 raise MythrilExecutionError(f"Mythril Scan Failed. Stderr: {stderr_str}")
             else:
@@ -78,30 +107,62 @@ class MythrilScanner(BaseScanner):
                 logger.error(f"Mythril STDERR: {stderr_str}")
             raise MythrilExecutionError(f"Mythril Scan Failed. Details: {stderr_str}")
 
+        # Output that cannot start a JSON document skips the parse attempt entirely
+        if looks_like_json(stdout):
+            try:
+                json_output = orjson.loads(stdout)
+                json_output['scanned_files'] = scanned_files
+                logger.info(f"Mythril analysis finished (Exit Code: {rc}). Issues found.")
+                return json_output
+            except orjson.JSONDecodeError:
+                pass
+
+        stderr_str = stderr.decode('utf-8', errors='ignore')
+        logger.error(f"Mythril output was not valid JSON. Stderr: {stderr_str}")
+        raise MythrilExecutionError(f"Mythril Scan Failed. Output was not valid JSON. Stderr: {stderr_str}")
+
+
+
+    def _execute_mythril_cached(self, target_path: str, file_path: str) -> Dict[str, Any]:
+        """
+        Returns Mythril's JSON output for a single file, reusing a cached result when
+        neither the file nor anything it imports has changed. Successful results are
+        written to the cache; errors are raised and never cached.
+        """
         try:
-            json_output = json.loads(stdout)
-            json_output['scanned_files'] = scanned_files
-            logger.info(f"Mythril analysis finished (Exit Code: {rc}). Issues found.")
+            closure_digest = source_closure_digest(target_path, file_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not hash Mythril sources for {file_path}: {e}")
+            closure_digest = None
+        if closure_digest is None or not disk_cache.DISK_CACHE_ENABLED:
+            return self._execute_mythril(target_path, relative_files=[file_path])
+
+        key = hashlib.blake2b(digest_size=16)
+        for part in (closure_digest, _MYTHRIL_VERSION, os.environ.get('MYTHRIL_SOLC_BINARY', ''), *MYTHRIL_FLAGS):
+            key.update(part.encode() + b'\0')
+        cache_path = os.path.join(MYTHRIL_CACHE_DIR, f"{key.hexdigest()}.json")
+
+        try:
+            with open(cache_path, 'rb') as f:
+                json_output = orjson.loads(f.read())
+            logger.info(f"Mythril: Reusing cached result for {file_path}")
+            json_output['scanned_files'] = [file_path]
             return json_output
-        except json.JSONDecodeError:
-            # If no valid JSON, try to read from output file
-            if os.path.exists(output_filepath):
-                try:
-                    with open(output_filepath, 'r') as f:
-                        json_output = json.load(f)
-                        json_output['scanned_files'] = scanned_files
-                        logger.info(f"Mythril analysis finished (Exit Code: {rc}). Issues found.")
-                        return json_output
-                except (FileNotFoundError, json.JSONDecodeError):
-                    pass
-            
-            stderr_str = stderr.decode('utf-8', errors='ignore')
-            logger.error(f"Mythril output was not valid JSON. Stderr: {stderr_str}")
-            raise MythrilExecutionError(f"Mythril Scan Failed. Output was not valid JSON. Stderr: {stderr_str}")
+        except FileNotFoundError:
+            pass
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable Mythril cache entry {cache_path}: {e}")
 
+        json_output = self._execute_mythril(target_path, relative_files=[file_path])
 
+        try:
+            disk_cache.write_entry(MYTHRIL_CACHE_DIR, cache_path, orjson.dumps(json_output))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache Mythril result for {file_path}: {e}")
+
+        return json_output
 
-    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> List[Dict[str, Any]]:
+    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> List[Issue]:
         """
         Runs Mythril on the target_path.
 
@@ -111,7 +172,7 @@ class MythrilScanner(BaseScanner):
             config: Optional ScanConfig object containing filtering rules (min_severity)
 
         Returns:
-            List of cleaned issue dictionaries, filtered by severity
+            List of cleaned issues, filtered by severity
         """
         logger.info(f"🔍 Starting Mythril scan on: {target_path}")
 
@@ -121,86 +182,131 @@ class MythrilScanner(BaseScanner):
 
         relative_files = None
         if files:
-            relative_files = [os.path.relpath(f, target_path) for f in files]
+            relative_files = relative_paths(target_path, files)
 
-        raw_output = self._execute_mythril(target_path, relative_files=relative_files)
+        raw_outputs = self._execute_per_file(target_path, relative_files, config)
 
         # Extract min_severity from config, default to 'Low'
         min_severity = config.get_min_severity() if config else 'Low'
         logger.debug(f"🎯 Mythril: Filtering issues with minimum severity: {min_severity}")
 
-        clean_issues: List[Dict[str, Any]] = []
-
-        # Handle different Mythril output formats
-        issues_list = raw_output.get("issues", [])
-        if not issues_list and isinstance(raw_output, dict):
-            # Try alternative format
-            issues_list = []
-
-        for issue in issues_list:
-            # Map Mythril severity to our standard format
-            mythril_severity = issue.get('severity', 'Informational')
-            if mythril_severity == 'High':
-                severity = 'High'
-            elif mythril_severity == 'Medium':
-                severity = 'Medium'
-            elif mythril_severity == 'Low':
-                severity = 'Low'
-            else:
-                severity = 'Informational'
+        # Resolve the threshold once rather than per issue
+        min_severity_level = self._severity_threshold(min_severity)
 
-            severity_level = self.SEVERITY_MAP.get(severity.lower(), 1)
-
-            # Skip issues below the minimum severity threshold
-            if severity_level < self.SEVERITY_MAP.get(min_severity.lower(), 2):
-                logger.debug(f"Mythril: Filtering out {severity} issue: {issue.get('title', 'Unknown')}")
-                continue
+        clean_issues: List[Issue] = []
+        append = clean_issues.append
+        clean_issue = self._clean_issue
+        raw_data = self._raw_data_converter(config)
+        # Drop repeats of the same (type, file, line) as they are produced
+        seen: set = set()
 
-            # Extract file and line information
-            # Mythril doesn't provide file paths directly in issues, but we know which files we scanned
+        for raw_output in raw_outputs:
+            # Each output carries the files it was produced from for attribution
             scanned_files = raw_output.get('scanned_files', [])
-            
-            # Get file from scanned files (Mythril typically scans one file at a time in our setup)
-            if scanned_files and len(scanned_files) == 1:
-                file_path = scanned_files[0]
-            elif scanned_files:
-                # Multiple files - try to match by contract name if available
-                contract_name = issue.get('contract', '')
-                file_path = scanned_files[0]  # Default to first file
-                for f in scanned_files:
-                    if contract_name.lower() in f.lower():
-                        file_path = f
-                        break
-            else:
-                file_path = 'Unknown'
-            
-            # Parse source map for line information
-            # Mythril provides sourceMap in format "offset:length:sourceIndex:jump"
-            source_map = issue.get('sourceMap', '')
-            line_number = 0
-            if source_map and source_map != 'Unknown':
-                byte_offset = self._parse_source_map(source_map)
-                # Approximate line number from byte offset (rough estimate: ~40 chars per line)
-                # This is imprecise but better than 0
-                if byte_offset > 0:
-                    line_number = max(1, byte_offset // 40)
-
-            clean_issues.append({
-                "tool": self.TOOL_NAME,
-                "type": issue.get('title', 'Unknown'),
-                "severity": severity,
-                "confidence": issue.get('confidence', 'Low').capitalize() if issue.get('confidence') else 'Medium',
-                "description": issue.get('description', 'No description'),
-                "file": file_path,
-                "line": int(line_number) if line_number else 0,
-                "function": issue.get('function', 'Unknown'),
-                "swc_id": issue.get('swc-id', ''),
-                "raw_data": issue
-            })
+            for issue in raw_output.get("issues", []):
+                cleaned = clean_issue(issue, scanned_files, min_severity_level, raw_data)
+                if cleaned is None:
+                    continue
+                key = (cleaned.type, cleaned.file, cleaned.line)
+                if key not in seen:
+                    seen.add(key)
+                    append(cleaned)
 
         logger.info(f"Mythril found {len(clean_issues)} total issues meeting the severity threshold (Min: {min_severity}).")
         return clean_issues
 
+    def _execute_per_file(self, target_path: str, relative_files: Optional[List[str]], config=None) -> List[Dict[str, Any]]:
+        """
+        Runs Mythril once per file in a thread pool so each output maps to exactly one file,
+        and a contract whose symbolic execution fails or times out only loses its own
+        findings. Falls back to a single invocation for full-repository scans or a single file.
+
+        Returns the raw Mythril outputs in the order of relative_files.
+        Raises MythrilExecutionError only if every invocation failed.
+        """
+        if not relative_files:
+            return [self._execute_mythril(target_path, relative_files=relative_files)]
+        if len(relative_files) == 1:
+            return [self._execute_mythril_cached(target_path, relative_files[0])]
+
+        max_workers = getattr(config, 'max_concurrent_scans', None) or os.cpu_count() or 1
+        max_workers = min(len(relative_files), max_workers)
+        logger.info(f"⚡ Mythril: Scanning {len(relative_files)} files with {max_workers} worker(s)")
+
+        results = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(self._execute_mythril_cached, target_path, f) for f in relative_files]
+            for file_path, future in zip(relative_files, futures):
+                try:
+                    results.append(future.result())
+                except MythrilExecutionError as e:
+                    logger.error(f"⚠️ Mythril failed on file {file_path}: {e}")
+                    errors.append(e)
+
+        if not results:
+            raise errors[0]
+        return results
+
+    def _clean_issue(self, issue: Dict[str, Any], scanned_files: List[str], min_severity_level: int, raw_data: Callable[[Any], Any]) -> Optional[Issue]:
+        """
+        Converts a raw Mythril issue to the standard format.
+        Returns None if the issue is below the minimum severity threshold.
+        """
+        # Map Mythril severity to our standard format
+        severity = self.MYTHRIL_SEVERITY.get(issue.get('severity'), 'Informational')
+        # Always present: every mapped severity is a capitalized SEVERITY_MAP key
+        severity_level = self.SEVERITY_RANKS[severity]
+
+        # Skip issues below the minimum severity threshold; with a high threshold most
+        # findings end here, so the message is only formatted when it will be logged
+        if severity_level < min_severity_level:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Mythril: Filtering out {severity} issue: {issue.get('title', 'Unknown')}")
+            return None
+
+        # Extract file and line information
+        # Mythril doesn't provide file paths directly in issues, but we know which files we scanned
+        # Get file from scanned files (Mythril typically scans one file at a time in our setup)
+        if scanned_files and len(scanned_files) == 1:
+            file_path = scanned_files[0]
+        elif scanned_files:
+            # Multiple files - try to match by contract name if available
+            contract_name = issue.get('contract', '')
+            file_path = scanned_files[0]  # Default to first file
+            for f in scanned_files:
+                if contract_name.lower() in f.lower():
+                    file_path = f
+                    break
+        else:
+            file_path = 'Unknown'
+        
+        # Parse source map for line information
+        # Mythril provides sourceMap in format "offset:length:sourceIndex:jump"
+        source_map = issue.get('sourceMap', '')
+        line_number = 0
+        if source_map and source_map != 'Unknown':
+            byte_offset = self._parse_source_map(source_map)
+            # Approximate line number from byte offset (rough estimate: ~40 chars per line)
+            # This is imprecise but better than 0
+            if byte_offset > 0:
+                line_number = max(1, byte_offset // 40)
+
+        confidence = issue.get('confidence')
+
+        return Issue(
+            tool=self.TOOL_NAME,
+            type=issue.get('title', 'Unknown'),
+            severity=severity,
+            confidence=confidence.capitalize() if confidence else 'Medium',
+            description=issue.get('description', 'No description'),
+            file=file_path,
+            line=int(line_number) if line_number else 0,
+            function=issue.get('function', 'Unknown'),
+            swc_id=issue.get('swc-id', ''),
+            raw_data=raw_data(issue),
+        )
+
     def _parse_source_map(self, source_map: str) -> int:
         """
         Parse Solidity source map format to extract line offset.
@@ -209,9 +315,9 @@ class MythrilScanner(BaseScanner):
         Returns the byte offset which can be used for approximate line location.
         """
         try:
-            parts = source_map.split(':')
-            if parts:
-                return int(parts[0])  # Return byte offset
-        except (ValueError, IndexError):
+            # Only the first field is needed, so slice it out rather than split the whole map
+            end = source_map.find(':')
+            return int(source_map[:end] if end >= 0 else source_map)  # Return byte offset
+        except ValueError:
             pass
         return 0
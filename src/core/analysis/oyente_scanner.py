@@ -1,10 +1,16 @@
-import subprocess
-import json
 import os
+import shutil
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Iterator, Optional, TYPE_CHECKING
 
-from src.core.analysis.base_scanner import BaseScanner, OyenteExecutionError
+import orjson
+
+from src.core.tools import disk_cache, solc_select
+from src.core.tools.run_tool import is_blank, run_tool
+from src.core.analysis.base_scanner import BaseScanner, Issue, OyenteExecutionError, expand_severity_keys, source_closure_digest
 
 if TYPE_CHECKING:
     from src.core.config import AuditConfig
@@ -12,40 +18,76 @@ if TYPE_CHECKING:
 # Configure a logger for this module
 logger = logging.getLogger(__name__)
 
-
-class OyenteScanner(BaseScanner):
+# Directories that hold dependencies, tests or build output rather than project contracts.
+# Full scans prune them from the walk so Oyente is never spawned on their files.
+_SKIP_DIR_NAMES = frozenset({
+    "node_modules", "test", "tests", "lib", "out", "cache", "artifacts", "forge-cache",
+})
+# Vendored copies of well-known libraries, matched against the lowercased relative path
+_SKIP_PATH_PARTS = ("openzeppelin/", "uniswap/", "pancakeswap/")
+
+# Default cap on concurrent oyente processes; each one holds a solc/z3 child and its
+# pipes, so hundreds of files must queue rather than all start at once
+MAX_PARALLEL_SCANS = min(os.cpu_count() or 4, 16)
+
+# Oyente output keyed by Oyente version, solc and the digest of a file and the sources it
+# imports, so byte-identical contracts (e.g. the same library copied across packages) are
+# only analyzed once
+OYENTE_CACHE_DIR = os.environ.get(
+    "OYENTE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "audit-pit-crew", "oyente")
+)
+
+_oyente_version: Optional[str] = None
+_oyente_version_lock = threading.Lock()
+
+
+def _get_oyente_version() -> str:
+    """Returns the installed Oyente version, asking the CLI once per process."""
+    global _oyente_version
+    with _oyente_version_lock:
+        if _oyente_version is None:
+            rc, stdout, _, _, _ = run_tool(["oyente", "--version"], timeout=30)
+            version = stdout.decode('utf-8', errors='ignore').strip() if rc == 0 else ''
+            # Keep the version usable as a single path component
+            _oyente_version = version.replace(os.sep, '_').replace(' ', '_') or 'unknown'
+        return _oyente_version
+
+
+def _solc_identity() -> str:
     """
-    Wraps the Oyente CLI tool to scan Solidity files for security vulnerabilities.
-    Oyente performs bytecode-level analysis on compiled smart contracts.
+    Identifies the solc Oyente compiles with: the SOLC_VERSION override, else the
+    solc-select global version, else the resolved solc binary.
     """
+    version = os.environ.get("SOLC_VERSION") or solc_select.read_global_version()
+    if version:
+        return version
+    solc_bin = shutil.which("solc")
+    return os.path.realpath(solc_bin) if solc_bin else 'unknown'
 
-    TOOL_NAME = "Oyente"
-
-    # Severity mapping from Oyente's native severity levels to standard system levels
-    SEVERITY_MAP = {
-        'critical': 'Critical',
-        'high': 'High',
-        'medium': 'Medium',
-        'warning': 'Medium',
-        'low': 'Low',
-        'informational': 'Low',
-        'info': 'Low',
-        'note': 'Low',
-    }
-
-    import json
-import os
-import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
-
-from src.core.tools.run_tool import run_tool
-from src.core.analysis.base_scanner import BaseScanner, OyenteExecutionError
 
-if TYPE_CHECKING:
-    from src.core.config import AuditConfig
+def _iter_sol_files(root: str) -> Iterator[str]:
+    """
+    Yields the paths of project .sol files under root, relative to root.
 
-# Configure a logger for this module
-logger = logging.getLogger(__name__)
+    Uses os.scandir so directory checks come from the DirEntry without extra stat
+    calls, and builds relative paths by slicing off the root prefix instead of
+    calling os.path.relpath per file.
+    """
+    prefix_len = len(os.path.join(root, ''))
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip hidden, dependency, test and build directories
+                    if not name.startswith('.') and name not in _SKIP_DIR_NAMES:
+                        pending.append(entry.path)
+                elif name.endswith('.sol'):
+                    rel_path = entry.path[prefix_len:]
+                    normalized = rel_path.replace(os.sep, '/').lower()
+                    if not any(part in normalized for part in _SKIP_PATH_PARTS):
+                        yield rel_path
 
 
 class OyenteScanner(BaseScanner):
@@ -68,6 +110,8 @@ class OyenteScanner(BaseScanner):
         'note': 'Low',
     }
 
+    SEVERITY_LOOKUP = expand_severity_keys(SEVERITY_MAP)
+
     def _execute_oyente(self, target_path: str, file_path: str) -> Dict[str, Any]:
         """
         Executes the Oyente CLI tool against a single Solidity file.
@@ -86,17 +130,18 @@ class OyenteScanner(BaseScanner):
         # Construct the command
         cmd = ["oyente", "-s", file_path, "-j"]
 
-        logger.info(f"Executing Oyente command: {' '.join(cmd)}")
-        logger.info(f"Working directory (cwd): {target_path}")
+        # Runs once per file, so let logging format the arguments only if emitted
+        logger.info("Executing Oyente command: %s", cmd)
+        logger.debug("Working directory (cwd): %s", target_path)
 
         rc, stdout, stderr, out_path, err_path = run_tool(cmd, cwd=target_path, timeout=300)
 
         logger.info(f"Oyente stdout log: {out_path}")
         logger.info(f"Oyente stderr log: {err_path}")
 
-        if not stdout.strip():
-            stderr_str = stderr.decode('utf-8', errors='ignore')
-            if stderr_str.strip():
+        if is_blank(stdout):
+            if not is_blank(stderr):
+                stderr_str = stderr.decode('utf-8', errors='ignore')
                 logger.error(f"tool_error: Oyente stdout was empty, but stderr contained: {stderr_str}")
                 raise OyenteExecutionError(f"Oyente Scan Failed. Stderr: {stderr_str}")
             else:
@@ -104,26 +149,120 @@ class OyenteScanner(BaseScanner):
                 return {"issues": []}
 
         if rc != 0:
-            stderr_str = stderr.decode('utf-8', errors='ignore')
             logger.warning(f"⚠️ Oyente exited with code {rc}")
-            if stderr_str:
-                logger.debug(f"Oyente stderr: {stderr_str}")
-
-        if stdout.strip():
-            try:
-                json_output = json.loads(stdout)
-                return json_output
-            except json.JSONDecodeError as e:
-                stderr_str = stderr.decode('utf-8', errors='ignore')
-                logger.warning(f"⚠️ Oyente output is not valid JSON: {e}")
-                logger.debug(f"Oyente stdout: {stdout.decode('utf-8', errors='ignore')}")
-                raise OyenteExecutionError(f"Oyente Scan Failed. Output not valid JSON. Stderr: {stderr_str}")
+            # stderr is only decoded when the debug line will actually be emitted
+            if stderr and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Oyente stderr: %s", stderr.decode('utf-8', errors='ignore'))
+
+        # stdout stays bytes all the way into the parser
+        try:
+            return orjson.loads(stdout)
+        except orjson.JSONDecodeError as e:
+            stderr_str = stderr.decode('utf-8', errors='ignore')
+            logger.warning(f"⚠️ Oyente output is not valid JSON: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Oyente stdout: %s", stdout.decode('utf-8', errors='ignore'))
+            raise OyenteExecutionError(f"Oyente Scan Failed. Output not valid JSON. Stderr: {stderr_str}")
+
+
+
+    def _execute_oyente_cached(self, target_path: str, file_path: str) -> Dict[str, Any]:
+        """
+        Returns Oyente's JSON output for a file, reusing a cached result when a file with
+        the same content and the same imported sources was already analyzed by the same
+        Oyente version and solc. Successful results are written to the cache; errors are
+        raised and never cached.
+        """
+        # oyente -s compiles everything the file imports, so the key covers the closure
+        try:
+            closure_digest = source_closure_digest(target_path, file_path, include_root_path=False)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not hash Oyente sources for {file_path}: {e}")
+            closure_digest = None
+        if closure_digest is None or not disk_cache.DISK_CACHE_ENABLED:
+            return self._execute_oyente(target_path, file_path)
+
+        key = hashlib.blake2b(digest_size=16)
+        for part in (closure_digest, _solc_identity()):
+            key.update(part.encode() + b'\0')
+        cache_dir = os.path.join(OYENTE_CACHE_DIR, _get_oyente_version())
+        cache_path = os.path.join(cache_dir, f"{key.hexdigest()}.json")
+
+        try:
+            with open(cache_path, 'rb') as f:
+                json_output = orjson.loads(f.read())
+            logger.info(f"Oyente: Reusing cached result for {file_path}")
+            return json_output
+        except FileNotFoundError:
+            pass
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable Oyente cache entry {cache_path}: {e}")
+
+        json_output = self._execute_oyente(target_path, file_path)
+
+        try:
+            disk_cache.write_entry(OYENTE_CACHE_DIR, cache_path, orjson.dumps(json_output))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache Oyente result for {file_path}: {e}")
+
+        return json_output
+
+    def _convert_issues(self, raw_issues: List[Dict[str, Any]], file_path: str, threshold: int, raw_data: Callable[[Any], Any]) -> Iterator[Issue]:
+        """
+        Yields standard issues for the raw Oyente findings at or above the threshold
+        rank. Severity is checked first, so filtered findings never get an Issue.
+        """
+        severity_lookup = self.SEVERITY_LOOKUP
+        severity_map = self.SEVERITY_MAP
+        ranks = self.SEVERITY_RANKS
+
+        for raw_issue in raw_issues:
+            raw_severity = raw_issue.get('severity') or 'low'
+            severity = severity_lookup.get(raw_severity) or severity_map.get(raw_severity.lower(), 'Low')
+            if ranks[severity] < threshold:
+                continue
 
-        return {"issues": []}
+            # Convert Oyente's format to the standard issue record
+            yield Issue(
+                tool=self.TOOL_NAME,
+                type=raw_issue.get('title', raw_issue.get('name', 'Unknown')),
+                severity=severity,
+                confidence=raw_issue.get('confidence', 'Unknown'),
+                description=raw_issue.get('description', ''),
+                file=file_path,
+                line=raw_issue.get('line', 0),
+                raw_data=raw_data(raw_issue),
+            )
+
+    def _scan_one(self, target_path: str, file_path: str, threshold: int, raw_data: Callable[[Any], Any]) -> List[Issue]:
+        """
+        Runs Oyente on a single file and converts its findings at or above the threshold
+        rank to standard issues. Failures are logged and yield no issues, so one bad file
+        doesn't stop the others.
+        """
+        # Verify file exists
+        full_path = os.path.join(target_path, file_path)
+        if not os.path.isfile(full_path):
+            logger.warning(f"⚠️ File not found (will skip): {full_path} (Exists: {os.path.exists(full_path)})")
+            return []
+
+        try:
+            logger.info(f"📄 Scanning file with Oyente: {file_path}")
+            json_output = self._execute_oyente_cached(target_path, file_path)
 
+            # Parse Oyente output and convert to standard format
+            issues = list(self._convert_issues(json_output.get("issues", []), file_path, threshold, raw_data))
+
+        except OyenteExecutionError as e:
+            logger.error(f"⚠️ Oyente failed on file {file_path}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"❌ Unexpected error processing Oyente output for {file_path}: {e}", exc_info=True)
+            return []
 
+        return issues
 
-    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> List[Dict[str, Any]]:
+    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> List[Issue]:
         """
         Runs Oyente on the specified files.
 
@@ -133,7 +272,7 @@ class OyenteScanner(BaseScanner):
             config: Optional AuditConfig object containing filtering rules (min_severity)
 
         Returns:
-            List of standardized issue dictionaries
+            List of standardized issues
         """
         logger.info("🔍 Starting Oyente scan on: {}".format(target_path))
 
@@ -145,14 +284,7 @@ class OyenteScanner(BaseScanner):
         if files is None:
             logger.info("⚙️ Oyente: Running full scan on repository root.")
             # For full scan, find all .sol files
-            sol_files = []
-            for root, dirs, filenames in os.walk(target_path):
-                # Skip node_modules and hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'node_modules']
-                for filename in filenames:
-                    if filename.endswith('.sol'):
-                        rel_path = os.path.relpath(os.path.join(root, filename), target_path)
-                        sol_files.append(rel_path)
+            sol_files = list(_iter_sol_files(target_path))
             files = sol_files if sol_files else None
 
         if not files:
@@ -161,54 +293,39 @@ class OyenteScanner(BaseScanner):
 
         logger.info(f"⚡ Oyente: Running partial scan on: {files}")
 
-        all_issues: List[Dict[str, Any]] = []
-
-        # Scan each file
-        for file_path in files:
-            # Verify file exists
-            full_path = os.path.join(target_path, file_path)
-            if not os.path.isfile(full_path):
-                logger.warning(f"⚠️ File not found (will skip): {full_path} (Exists: {os.path.exists(full_path)})")
-                continue
-
-            try:
-                logger.info(f"📄 Scanning file with Oyente: {file_path}")
-                json_output = self._execute_oyente(target_path, file_path)
-
-                # Parse Oyente output and convert to standard format
-                issues = json_output.get("issues", [])
-
-                for raw_issue in issues:
-                    # Convert Oyente's format to standard issue dictionary
-                    issue = {
-                        'type': raw_issue.get('title', raw_issue.get('name', 'Unknown')),
-                        'severity': self.SEVERITY_MAP.get(
-                            raw_issue.get('severity', 'low').lower(),
-                            'Low'
-                        ),
-                        'confidence': raw_issue.get('confidence', 'Unknown'),
-                        'description': raw_issue.get('description', ''),
-                        'file': file_path,
-                        'line': raw_issue.get('line', 0),
-                        'tool': self.TOOL_NAME,
-                        'raw_data': raw_issue,
-                    }
-                    all_issues.append(issue)
-
-            except OyenteExecutionError as e:
-                logger.error(f"⚠️ Oyente failed on file {file_path}: {e}")
-                # Continue with next file
-                continue
-            except Exception as e:
-                logger.error(f"❌ Unexpected error processing Oyente output for {file_path}: {e}", exc_info=True)
-                continue
-
-        # Apply severity filtering
+        # Resolve the severity threshold once; each file's findings are filtered as they
+        # are converted. Accepts AuditConfig (nested) or ScanConfig (direct).
         min_severity = 'Low'
         if config and hasattr(config, 'scan') and hasattr(config.scan, 'min_severity'):
             min_severity = config.scan.min_severity
+        elif config and hasattr(config, 'min_severity'):
+            min_severity = config.min_severity
 
         logger.debug(f"🎯 Oyente: Filtering issues with minimum severity: {min_severity}")
-        filtered_issues = self._filter_by_severity(all_issues, min_severity)
-
-        return filtered_issues
+        threshold = self._severity_threshold(min_severity)
+        raw_data = self._raw_data_converter(config)
+
+        max_workers = getattr(config, 'max_concurrent_scans', None) or MAX_PARALLEL_SCANS
+        if len(files) > max_workers:
+            logger.info(f"Oyente: {len(files)} files queued behind {max_workers} worker(s)")
+        max_workers = min(len(files), max_workers)
+
+        all_issues: List[Issue] = []
+        append = all_issues.append
+        # Drop repeats of the same (type, file, line) as results are collected, matching
+        # the fingerprint UnifiedScanner uses for this tool
+        seen: set = set()
+
+        # Scan files concurrently; each worker just waits on an oyente subprocess and the
+        # pool size is the cap on how many run at once.
+        # Results are collected in file order so the output stays deterministic.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(self._scan_one, target_path, file_path, threshold, raw_data) for file_path in files]
+            for future in futures:
+                for issue in future.result():
+                    key = (issue.type, issue.file, issue.line)
+                    if key not in seen:
+                        seen.add(key)
+                        append(issue)
+
+        return all_issues
@@ -1,10 +1,18 @@
-import json
+import copy
 import os
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, ClassVar, Iterable, Iterator, Optional, TYPE_CHECKING, Tuple
 
-from src.core.tools.run_tool import run_tool
-from src.core.analysis.base_scanner import BaseScanner, SlitherExecutionError
+import ijson
+import orjson
+
+from src.core.tools import disk_cache, solc_select
+from src.core.tools.run_tool import TIMEOUT_EXIT_CODE, run_tool
+from src.core.analysis.base_scanner import BaseScanner, Issue, SlitherExecutionError, relative_paths, source_closure_digest
 
 if TYPE_CHECKING:
     from src.core.config import AuditConfig
@@ -12,6 +20,139 @@ if TYPE_CHECKING:
 # Configure a logger for this module
 logger = logging.getLogger(__name__)
 
+# Reports larger than this are streamed detector by detector instead of loaded whole.
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+SOLC_VERSION = "0.8.20"
+
+# Wall-clock limit for one slither invocation; a hung solc compile is killed after this
+SLITHER_TIMEOUT = int(os.environ.get("SLITHER_TIMEOUT", "300"))
+
+# Successful reports keyed by a digest of the project sources, the solc version and
+# the slither arguments, so re-scanning an unchanged tree skips slither entirely
+SLITHER_CACHE_DIR = os.environ.get(
+    "SLITHER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "audit-pit-crew", "slither")
+)
+
+# Filtered results of the most recent runs kept in memory, per worker process
+RESULT_CACHE_SIZE = 32
+
+# Non-Solidity files that change how the project compiles
+_BUILD_CONFIG_NAMES = frozenset({
+    "foundry.toml", "remappings.txt", "hardhat.config.js", "hardhat.config.ts",
+    "truffle-config.js", "slither.config.json",
+})
+
+_HASH_CHUNK_BYTES = 64 * 1024
+
+# Per-file digests keyed by absolute path, with the (mtime_ns, size) they were computed
+# at, so re-hashing an unchanged tree only costs a stat per file
+_FILE_DIGEST_CACHE_SIZE = 65536
+_file_digests: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+_file_digests_lock = threading.Lock()
+
+# Changed files under these directories are dependencies or tests, not audit targets
+_EXCLUDED_DIR_NAMES = frozenset({"node_modules", "lib", "test"})
+
+# The same directories as one --filter-paths regex, so slither drops findings in them
+# too. Sorted so the command line, and with it the report cache key, is stable.
+_FILTER_PATHS_REGEX = r"(^|/)({})/".format("|".join(sorted(_EXCLUDED_DIR_NAMES)))
+
+
+def _iter_source_files(root: str) -> Iterator[str]:
+    """
+    Yields the paths, relative to root, of every file that can affect a Slither run:
+    all .sol files (dependencies included, since they are compiled too) and build config.
+    """
+    prefix_len = len(os.path.join(root, ''))
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith('.'):
+                        pending.append(entry.path)
+                elif name.endswith('.sol') or name in _BUILD_CONFIG_NAMES:
+                    yield entry.path[prefix_len:]
+
+
+def _file_digest(path: str) -> bytes:
+    """
+    sha256 of a file's content, reused while its (mtime_ns, size) is unchanged.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    st = os.stat(path)
+    with _file_digests_lock:
+        cached = _file_digests.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _file_digests.move_to_end(path)
+            return cached[2]
+
+    file_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            file_hash.update(chunk)
+    digest = file_hash.digest()
+
+    with _file_digests_lock:
+        _file_digests[path] = (st.st_mtime_ns, st.st_size, digest)
+        _file_digests.move_to_end(path)
+        while len(_file_digests) > _FILE_DIGEST_CACHE_SIZE:
+            _file_digests.popitem(last=False)
+    return digest
+
+
+def _source_digest(target_path: str) -> str:
+    """
+    Merkle-style digest of the project: each source file is hashed on its own and the
+    sorted (path, file digest) pairs are combined into one root hash.
+    """
+    abs_root = os.path.abspath(target_path)
+    root = hashlib.sha256()
+    for rel_path in sorted(_iter_source_files(target_path)):
+        root.update(b'\0' + rel_path.encode() + b'\0')
+        root.update(_file_digest(os.path.join(abs_root, rel_path)))
+    return root.hexdigest()
+
+
+def _closure_digests(target_path: str, relative_files: List[str]) -> List[Optional[str]]:
+    """
+    Per-file digests for a differential scan: each changed file with the sources it
+    imports, plus the build config at the repository root. Only what a single-file
+    slither run compiles is read, instead of the whole tree.
+
+    A file gets None when its imports cannot be resolved or read, so it is scanned
+    without the cache.
+    """
+    config = hashlib.sha256()
+    for name in sorted(_BUILD_CONFIG_NAMES):
+        config_path = os.path.join(target_path, name)
+        if os.path.isfile(config_path):
+            config.update(name.encode() + b'\0')
+            config.update(_file_digest(os.path.abspath(config_path)))
+    config_digest = config.hexdigest()
+
+    digests = []
+    for rel_path in relative_files:
+        try:
+            closure_digest = source_closure_digest(target_path, rel_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not hash Slither sources for {rel_path}: {e}")
+            closure_digest = None
+        digests.append(None if closure_digest is None else f"{closure_digest}:{config_digest}")
+    return digests
+
+
+def _report_cache_key(source_digest: str, cmd: List[str]) -> str:
+    """Combines the project's source digest with the solc version and slither arguments."""
+    key = hashlib.sha256(source_digest.encode())
+    key.update(SOLC_VERSION.encode())
+    key.update(b'\0'.join(arg.encode() for arg in cmd[1:]))
+    return key.hexdigest()
+
 
 class SlitherScanner(BaseScanner):
     """
@@ -20,51 +161,143 @@ class SlitherScanner(BaseScanner):
 
     TOOL_NAME = "Slither"
 
-    def _execute_slither(self, target_path: str, relative_files: Optional[List[str]] = None) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+    # solc version last selected by this process, and the pid that selected it, so a
+    # forked worker re-applies it. The lock keeps per-file threads from racing.
+    _active_solc_version: ClassVar[Optional[Tuple[int, str]]] = None
+    _solc_select_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # In-memory tier in front of the report cache: filtered issue lists keyed by
+    # (target path, source digests, scanned files, severity threshold, raw_data handling),
+    # most recent last
+    _result_cache: ClassVar[OrderedDict] = OrderedDict()
+    _result_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def _ensure_solc_version(self, target_path: str) -> None:
         """
-        Executes the slither command and returns the JSON output.
-        Raises SlitherExecutionError on failure.
-        
-        Args:
-            target_path: Path to the repository root (working directory for slither)
-            relative_files: List of relative file paths to scan (relative to target_path)
+        Selects SOLC_VERSION for solc-select unless this process already did so
+        successfully. Failures are logged and retried on the next scan.
         """
-        # --- Verify files exist before passing to slither ---
-        if relative_files:
-            existing_files = []
-            for file_path in relative_files:
-                full_path = os.path.join(target_path, file_path)
-                if os.path.isfile(full_path):
-                    existing_files.append(file_path)
-                    logger.debug(f"✓ File exists: {full_path}")
+        solc_version_to_use = SOLC_VERSION
+        active = (os.getpid(), solc_version_to_use)
+        with SlitherScanner._solc_select_lock:
+            if SlitherScanner._active_solc_version == active:
+                return
+            if self._write_global_solc_version(solc_version_to_use):
+                SlitherScanner._active_solc_version = active
+                return
+            try:
+                logger.info(f"🐍 Attempting to set solc version using 'solc-select use {solc_version_to_use}'...")
+                rc, _, stderr, _, _ = run_tool(
+                    ["solc-select", "use", solc_version_to_use],
+                    cwd=target_path,
+                    timeout=60
+                )
+                if rc == 0:
+                    logger.info(f"✅ Successfully set solc version to {solc_version_to_use}.")
+                    SlitherScanner._active_solc_version = active
                 else:
-                    logger.warning(f"⚠️ File not found (will skip): {full_path} (Exists: {os.path.exists(full_path)})")
-            
-            if not existing_files:
-                logger.warning(f"⚠️ No Solidity files found at specified paths. Falling back to full scan.")
-                relative_files = None
-            else:
-                relative_files = existing_files
-        
-        # --- Set solc version ---
+                    logger.warning(f"⚠️ Could not set solc version via solc-select: {stderr.decode('utf-8', errors='ignore')}")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not set solc version via solc-select: {e}")
+
+    def _write_global_solc_version(self, version: str) -> bool:
+        """
+        Does what 'solc-select use' does for an installed version, without starting the
+        solc-select CLI: writes the version to solc-select's global-version file, which the
+        solc shim reads on every compile.
+
+        Returns False if the version is not installed or the file cannot be written,
+        so the caller falls back to the CLI.
+        """
+        if not os.path.isfile(solc_select.artifact_path(version)):
+            return False
+
+        if solc_select.read_global_version() == version:
+            logger.info(f"✅ solc version already set to {version}.")
+            return True
+
+        global_version_path = solc_select.global_version_path()
+        tmp_path = f"{global_version_path}.{os.getpid()}.tmp"
         try:
-            solc_version_to_use = "0.8.20"
-            logger.info(f"🐍 Attempting to set solc version using 'solc-select use {solc_version_to_use}'...")
-            rc, _, stderr, _, _ = run_tool(
-                ["solc-select", "use", solc_version_to_use],
-                cwd=target_path,
-                timeout=60
-            )
-            if rc == 0:
-                logger.info(f"✅ Successfully set solc version to {solc_version_to_use}.")
-            else:
-                logger.warning(f"⚠️ Could not set solc version via solc-select: {stderr.decode('utf-8', errors='ignore')}")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not set solc version via solc-select: {e}")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(version)
+            os.replace(tmp_path, global_version_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write {global_version_path}: {e}")
+            return False
+        logger.info(f"✅ Successfully set solc version to {version}.")
+        return True
+
+    def _stream_detectors(self, output_filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields detector results from a large Slither report file (the captured
+        stdout log), so only one detector is in memory at a time.
+        """
+        try:
+            with open(output_filepath, 'rb') as f:
+                yield from ijson.items(f, 'results.detectors.item', use_float=True)
+        except ijson.JSONError as e:
+            logger.error(f"❌ Slither report file is not valid JSON: {e}")
+            raise SlitherExecutionError(f"Slither Scan Failed. Report file not valid JSON: {e}")
+
+    def _load_report(self, stdout: Optional[bytes], output_filepath: str) -> Dict[str, Any]:
+        """
+        Loads the Slither report written to stdout. Large reports, which run_tool
+        leaves on disk (stdout is None), keep their shape, but results.detectors is a
+        lazy stream read back from output_filepath, the file stdout was captured into.
 
-        output_filename = "slither_report.json"
-        output_filepath = os.path.join(target_path, output_filename)
+        Raises:
+            ValueError, ijson.JSONError: If the report is empty or not valid JSON
+        """
+        if stdout is not None:
+            # orjson takes the captured bytes directly and decodes UTF-8 itself
+            return orjson.loads(stdout)
+        return self._stream_report(output_filepath)
+
+    def _load_report_file(self, report_path: str) -> Dict[str, Any]:
+        """
+        Loads a Slither report from disk (e.g. a cache entry). Only reports at or below
+        STREAM_THRESHOLD_BYTES are read into memory; larger ones are streamed.
 
+        Raises:
+            OSError: If the file cannot be read
+            ValueError, ijson.JSONError: If the report is empty or not valid JSON
+        """
+        with open(report_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= STREAM_THRESHOLD_BYTES:
+                return orjson.loads(f.read())
+        return self._stream_report(report_path)
+
+    def _stream_report(self, report_path: str) -> Dict[str, Any]:
+        """
+        Returns a report dict whose results.detectors lazily streams from report_path.
+        Only the top-level "success" flag is read up front.
+        """
+        # "success" is the report's first key, so this stops after a few bytes
+        with open(report_path, 'rb') as f:
+            success = next(ijson.items(f, 'success'), None)
+        return {"success": success, "results": {"detectors": self._stream_detectors(report_path)}}
+
+    def _execute_slither(self, target_path: str, relative_files: Optional[List[str]], source_digest: Optional[str], min_rank: int, raw_data: Callable[[Any], Any]) -> Tuple[List[Issue], Dict[str, List[str]], bool]:
+        """
+        Executes the slither command and converts its report to standard issues.
+        Raises SlitherExecutionError on failure.
+
+        The report is consumed here, streamed reports included, so a malformed report
+        fails this invocation only, and it is cached only once it was read through.
+
+        Args:
+            target_path: Path to the repository root (working directory for slither)
+            relative_files: List of relative file paths to scan (relative to target_path),
+                already checked to exist by run()
+            source_digest: Digest of the sources this run compiles, as computed by run();
+                None when they could not be hashed, in which case the report cache is skipped
+            min_rank: Minimum severity rank of the issues to keep
+            raw_data: BaseScanner._raw_data_converter for the scan config
+
+        Returns:
+            The issues, the log paths, and whether the report was a complete success
+        """
         # --- Command Construction ---
         cmd = ["slither"]
         if relative_files:
@@ -74,25 +307,57 @@ class SlitherScanner(BaseScanner):
             logger.info("⚙️ Running full scan on repository root.")
             cmd.append(".")
 
-        # Append common flags
-        cmd.extend(["--exclude", "**/*.pem", "--json", output_filepath])
+        # Append common flags; "--json -" writes the report to stdout, which run_tool
+        # already captures, instead of a second report file in the repository
+        cmd.extend(["--filter-paths", _FILTER_PATHS_REGEX, "--json", "-"])
+
+        # --- Reuse a cached report for an unchanged tree ---
+        cache_path = None
+        if source_digest is not None and disk_cache.DISK_CACHE_ENABLED:
+            cache_path = os.path.join(SLITHER_CACHE_DIR, f"{_report_cache_key(source_digest, cmd)}.json")
+            try:
+                # A streamed entry is only parsed as it is consumed, so read it through
+                # here, where a truncated or corrupt entry can still be discarded
+                issues = list(self._iter_issues(self._report_detectors(self._load_report_file(cache_path)), min_rank, raw_data))
+                logger.info(f"Slither: Reusing cached report for unchanged sources ({cache_path})")
+                return issues, {}, True
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, ijson.JSONError, SlitherExecutionError) as e:
+                logger.warning(f"⚠️ Discarding unusable Slither cache entry {cache_path}: {e}")
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
 
-        logger.info(f"Executing Slither command: {' '.join(cmd)}")
-        logger.info(f"Working directory (cwd): {target_path}")
+        # --- Set solc version ---
+        self._ensure_solc_version(target_path)
+
+        logger.info("Executing Slither command: %s", cmd)
+        logger.info("Working directory (cwd): %s", target_path)
 
-        rc, stdout, stderr, out_path, err_path = run_tool(cmd, cwd=target_path, timeout=300)
+        # Reports above the stream threshold are never read into memory whole
+        rc, stdout, stderr, out_path, err_path = run_tool(
+            cmd, cwd=target_path, timeout=SLITHER_TIMEOUT, max_stdout_bytes=STREAM_THRESHOLD_BYTES
+        )
         
         log_paths = {self.TOOL_NAME: [out_path, err_path]}
 
-        # --- Error Handling based on output file ---
+        if rc == TIMEOUT_EXIT_CODE:
+            logger.error("❌ Slither timed out after %ds", SLITHER_TIMEOUT)
+            raise SlitherExecutionError(f"Slither Scan Failed. Timed out after {SLITHER_TIMEOUT}s")
+
+        # --- Error Handling based on the JSON report ---
         try:
-            with open(output_filepath, 'r') as f:
-                json_output = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            json_output = self._load_report(stdout, out_path)
+        except (ValueError, ijson.JSONError) as e:
             stderr_str = stderr.decode('utf-8', errors='ignore')
-            stdout_str = stdout.decode('utf-8', errors='ignore')
+            if stdout is not None:
+                stdout_str = stdout.decode('utf-8', errors='ignore')
+            else:
+                stdout_str = f"<{os.path.getsize(out_path)} bytes, see {out_path}>"
 
-            logger.error(f"❌ Slither execution failed to produce a valid report file (Exit Code {rc}). Exception: {e}")
+            logger.error(f"❌ Slither execution failed to produce a valid JSON report (Exit Code {rc}). Exception: {e}")
             if stdout_str:
                 logger.error(f"Slither STDOUT: {stdout_str}")
             if stderr_str:
@@ -103,15 +368,162 @@ class SlitherScanner(BaseScanner):
                 logger.error(f"❌ Slither could not find specified files. Ensure file paths are correct relative to {target_path}")
                 error_message = f"Slither could not find the specified files. This often indicates file path resolution issues or files that don't exist in the target repository."
             else:
-                error_message = stderr_str or stdout_str or f"Slither failed with exit code {rc} and did not produce a valid report file."
+                error_message = stderr_str or stdout_str or f"Slither failed with exit code {rc} and did not produce a valid JSON report."
             
             raise SlitherExecutionError(f"Slither Scan Failed. Details: {error_message}")
 
-        logger.info(f"Slither analysis finished (Exit Code: {rc}). Report read from {output_filepath}")
-        
-        return json_output, log_paths
+        logger.info(f"Slither analysis finished (Exit Code: {rc}). Report read from stdout")
+
+        try:
+            detectors = self._report_detectors(json_output)
+        except ValueError:
+            logger.warning(f"Slither output is empty or indicates failure. Raw: {str(json_output)[:500]}")
+            return [], log_paths, False
+        issues = list(self._iter_issues(detectors, min_rank, raw_data))
+
+        if cache_path:
+            self._store_report(cache_path, stdout, out_path)
+
+        return issues, log_paths, True
+
+    @staticmethod
+    def _report_detectors(json_output: Any) -> Iterable[Dict[str, Any]]:
+        """
+        Returns the detector results of a successful report.
+
+        Raises:
+            ValueError: If the report indicates failure or has no detector results
+        """
+        if not isinstance(json_output, dict) or not json_output.get("success"):
+            raise ValueError("report does not indicate success")
+        detectors = (json_output.get("results") or {}).get("detectors")
+        if detectors is None:
+            raise ValueError("report has no detector results")
+        return detectors
+
+    def _store_report(self, cache_path: str, report: Optional[bytes], report_path: str) -> None:
+        """
+        Writes a successful report to the cache, from memory if it was read, otherwise
+        by copying report_path.
+        """
+        try:
+            disk_cache.write_entry(SLITHER_CACHE_DIR, cache_path, report, report_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache Slither report: {e}")
+
+    @classmethod
+    def _cached_result(cls, key: Tuple) -> Optional[List[Issue]]:
+        """Returns copies of the issues cached under key, or None on a miss."""
+        with cls._result_cache_lock:
+            issues = cls._result_cache.get(key)
+            if issues is None:
+                return None
+            cls._result_cache.move_to_end(key)
+        # Callers may annotate the issues they get back, so hand out fresh records
+        return [copy.copy(issue) for issue in issues]
+
+    @classmethod
+    def _store_result(cls, key: Tuple, issues: List[Issue]) -> None:
+        """Caches copies of issues under key, evicting the least recently used entry."""
+        with cls._result_cache_lock:
+            cls._result_cache[key] = [copy.copy(issue) for issue in issues]
+            cls._result_cache.move_to_end(key)
+            while len(cls._result_cache) > RESULT_CACHE_SIZE:
+                cls._result_cache.popitem(last=False)
+
+    @classmethod
+    def reset_result_cache(cls) -> None:
+        """Clears the in-memory result cache, e.g. between jobs in a long-running worker."""
+        with cls._result_cache_lock:
+            cls._result_cache.clear()
+
+    def _execute_per_file(self, target_path: str, relative_files: Optional[List[str]], config, source_digests: List[Optional[str]], min_rank: int, raw_data: Callable[[Any], Any]) -> List[Tuple[List[Issue], Dict[str, List[str]], bool]]:
+        """
+        Runs Slither once per changed file in a thread pool, so a contract that fails to
+        compile, or whose report cannot be read, only loses its own findings. Falls back
+        to a single invocation for full-repository scans or a single file.
 
-    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+        source_digests holds the digest for each invocation: one per changed file, or the
+        tree digest for a full scan. A None entry disables the report cache for that run.
+
+        Returns the _execute_slither results of the invocations that did not raise, in
+        the order of relative_files.
+        Raises SlitherExecutionError only if every invocation failed.
+        """
+        if not relative_files or len(relative_files) == 1:
+            return [self._execute_slither(target_path, relative_files, source_digests[0], min_rank, raw_data)]
+
+        max_workers = getattr(config, 'max_concurrent_scans', None) or os.cpu_count() or 1
+        max_workers = min(len(relative_files), max_workers)
+        logger.info(f"⚡ Slither: Scanning {len(relative_files)} files with {max_workers} worker(s)")
+
+        # Each worker blocks on a slither subprocess, so threads give full parallelism
+        results = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self._execute_slither, target_path, [f], digest, min_rank, raw_data)
+                for f, digest in zip(relative_files, source_digests)
+            ]
+            for file_path, future in zip(relative_files, futures):
+                try:
+                    results.append(future.result())
+                except SlitherExecutionError as e:
+                    logger.error(f"⚠️ Slither failed on file {file_path}: {e}")
+                    errors.append(e)
+
+        if not results:
+            raise errors[0]
+        return results
+
+    def _iter_issues(self, detectors: Iterable[Dict[str, Any]], min_rank: int, raw_data: Callable[[Any], Any]) -> Iterator[Issue]:
+        """
+        Lazily converts Slither detector results to standard issues, skipping those below
+        min_rank. Fed a streamed report, it holds one detector at a time, so only the
+        issues that pass the filter are ever kept.
+        """
+        # Bind hot lookups to locals; this loop runs once per detector
+        ranks = self.SEVERITY_RANKS
+        severity_map = self.SEVERITY_MAP
+        informational_rank = severity_map['informational']
+        tool = self.TOOL_NAME
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        for issue in detectors:
+            get = issue.get
+
+            # Slither reports impact/importance in 'impact' field, already capitalized in
+            # practice, so the expanded rank map usually answers without a .lower() call.
+            # The severity check comes first so filtered detectors never touch 'elements'.
+            impact = get('impact', 'Informational')
+            severity_level = ranks.get(impact)
+            if severity_level is None:
+                severity_level = severity_map.get(impact.lower(), informational_rank)
+
+            # Skip issues below the minimum severity threshold
+            if severity_level < min_rank:
+                if debug:
+                    logger.debug(f"Slither: Filtering out {impact} issue: {get('check', 'Unknown')}")
+                continue
+
+            source_mapping = (get('elements') or [{}])[0].get('source_mapping') or {}
+            file_path = source_mapping.get('filename_relative', 'Unknown')
+            line_number = (source_mapping.get('lines') or [0])[0]
+
+            # Unless raw findings are requested, nothing keeps a reference to the detector,
+            # so each parsed detector (elements, source mappings) can be freed once consumed
+            yield Issue(
+                tool=tool,
+                type=get('check', 'Unknown'),
+                severity=impact.capitalize(),
+                confidence=get('confidence', 'Low').capitalize(),
+                description=get('description', 'No description'),
+                file=file_path,
+                line=int(line_number) if line_number else 0,
+                raw_data=raw_data(issue),
+            )
+
+    def run(self, target_path: str, files: Optional[List[str]] = None, config: Optional['AuditConfig'] = None) -> Tuple[List[Issue], Dict[str, List[str]]]:
         """
         Runs Slither on the target_path. For differential scans, it scans only the changed files.
         Filters issues by minimum severity from the config.
@@ -123,7 +535,7 @@ class SlitherScanner(BaseScanner):
 
         Returns:
             A tuple containing:
-                - List of cleaned issue dictionaries, filtered by severity
+                - List of standardized issues, filtered by severity
                 - Dictionary of log file paths
         """
         logger.info(f"🔍 Starting Slither scan on: {target_path}")
@@ -132,49 +544,76 @@ class SlitherScanner(BaseScanner):
             logger.info("⚠️ No files provided for Slither scan. Skipping.")
             return [], {}
 
-        relative_files = None
+        candidate_files = None
         if files:
-            relative_files = [os.path.relpath(f, target_path) for f in files]
-
-        raw_output, log_paths = self._execute_slither(target_path, relative_files=relative_files)
+            # Drop non-Solidity and dependency/test files before any tool setup, so diffs
+            # without auditable contracts never spawn solc-select or slither
+            candidate_files = [
+                rel_path for rel_path in relative_paths(target_path, files)
+                if rel_path.endswith('.sol')
+                and _EXCLUDED_DIR_NAMES.isdisjoint(rel_path.split(os.sep)[:-1])
+            ]
+            if not candidate_files:
+                logger.info("⚠️ No Solidity files changed, skipping Slither scan.")
+                return [], {}
 
         # Extract min_severity from config, default to 'Low'
         min_severity = config.get_min_severity() if config else 'Low'
         logger.debug(f"🎯 Slither: Filtering issues with minimum severity: {min_severity}")
 
-        clean_issues: List[Dict[str, Any]] = []
-
-        if not raw_output.get("success") or "results" not in raw_output or "detectors" not in raw_output["results"]:
-            logger.warning(f"Slither output is empty or indicates failure. Raw: {str(raw_output)[:500]}")
-            return [], log_paths
+        # Determine required minimum severity rank once (default to 'Low')
+        min_rank = self._severity_threshold(min_severity)
+        raw_data = self._raw_data_converter(config)
 
-        for issue in raw_output["results"]["detectors"]:
-            # Slither reports impact/importance in 'impact' field. Normalize and map to severity rank.
-            severity = issue.get('impact', 'Informational').capitalize()
-            severity_level = self.SEVERITY_MAP.get(severity.lower(), self.SEVERITY_MAP['informational'])
-
-            # Determine required minimum severity rank (default to 'Low')
-            min_rank = self.SEVERITY_MAP.get(min_severity.lower(), self.SEVERITY_MAP['low'])
-
-            # Skip issues below the minimum severity threshold
-            if severity_level < min_rank:
-                logger.debug(f"Slither: Filtering out {severity} issue: {issue.get('check', 'Unknown')}")
-                continue
-
-            primary_element = issue.get('elements', [{}])[0]
-            file_path = primary_element.get('source_mapping', {}).get('filename_relative', 'Unknown')
-            line_number = primary_element.get('source_mapping', {}).get('lines', [0])[0]
-
-            clean_issues.append({
-                "tool": self.TOOL_NAME,
-                "type": issue.get('check', 'Unknown'),
-                "severity": severity,
-                "confidence": issue.get('confidence', 'Low').capitalize(),
-                "description": issue.get('description', 'No description'),
-                "file": file_path,
-                "line": int(line_number) if line_number else 0,
-                "raw_data": issue
-            })
+        relative_files = None
+        if candidate_files:
+            relative_files = [f for f in candidate_files if os.path.isfile(os.path.join(target_path, f))]
+            if not relative_files:
+                logger.info("⚠️ No changed Solidity files exist in the tree, skipping Slither scan.")
+                return [], {}
+            # A differential scan only compiles the changed files and their imports
+            source_digests = _closure_digests(target_path, relative_files)
+        else:
+            try:
+                source_digests = [_source_digest(target_path)]
+            except OSError as e:
+                logger.warning(f"⚠️ Could not hash Slither sources, result caching disabled: {e}")
+                source_digests = [None]
+
+        # --- Reuse this process's result for an identical scan of unchanged sources ---
+        result_key = None
+        if None not in source_digests:
+            result_key = (
+                os.path.abspath(target_path), tuple(source_digests),
+                tuple(relative_files) if relative_files else None, min_rank, raw_data,
+            )
+            cached_issues = self._cached_result(result_key)
+            if cached_issues is not None:
+                logger.info(f"Slither: Reusing {len(cached_issues)} issue(s) from an identical scan in this process")
+                return cached_issues, {}
+
+        results = self._execute_per_file(target_path, relative_files, config, source_digests, min_rank, raw_data)
+        # Partial results (a per-file run failed) or failed reports are never cached
+        complete = len(results) == (len(relative_files) if relative_files else 1)
+
+        log_paths: Dict[str, List[str]] = {}
+        clean_issues = []
+        # Per-file runs also analyze shared imports, so the same finding can appear in
+        # more than one report; keep the first of each (type, file, line)
+        seen = set()
+
+        for issues, output_log_paths, succeeded in results:
+            for tool, paths in output_log_paths.items():
+                log_paths.setdefault(tool, []).extend(paths)
+            complete = complete and succeeded
+            for issue in issues:
+                key = (issue.type, issue.file, issue.line)
+                if key not in seen:
+                    seen.add(key)
+                    clean_issues.append(issue)
+
+        if result_key is not None and complete:
+            self._store_result(result_key, clean_issues)
 
         logger.info(f"Slither found {len(clean_issues)} total issues meeting the severity threshold (Min: {min_severity}).")
         return clean_issues, log_paths
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import List, Dict, Any, Optional, TYPE_CHECKING, Tuple
@@ -90,18 +91,24 @@ class UnifiedScanner:
         logger.info(f"📊 UnifiedScanner initialized with {len(self.scanners)} tool(s): {[s.TOOL_NAME for s in self.scanners]}")
         logger.info(f"🔄 UnifiedScanner: Starting multi-tool analysis on {target_path}")
 
+        run_start = time.time()
         all_issues: List[Dict[str, Any]] = []
         all_log_paths: Dict[str, List[str]] = {}
+        # Same fields and defaults as BaseScanner.get_issue_fingerprint, kept as tuples as
+        # in diff_issues: they reference the issue's own strings instead of formatting a
+        # new one per issue, and hash without building anything
         seen_fingerprints: set = set()
         tool_timings: Dict[str, float] = {}
         tool_status: Dict[str, str] = {}  # Track success/failure status
 
-        for scanner in self.scanners:
+        # Tools run concurrently; results are merged in scanner order so deduplication
+        # keeps the same issue regardless of which tool finished first
+        outcomes = asyncio.run(self._run_all(target_path, files, config))
+
+        for scanner, result, elapsed_time in outcomes:
             try:
-                logger.info(f"📌 Running {scanner.TOOL_NAME}...")
-                start_time = time.time()
-                result = scanner.run(target_path, files=files, config=config)
-                elapsed_time = time.time() - start_time
+                if isinstance(result, BaseException):
+                    raise result
                 tool_timings[scanner.TOOL_NAME] = elapsed_time
                 
                 if isinstance(result, tuple):
@@ -117,12 +124,18 @@ class UnifiedScanner:
 
                 # Deduplicate based on fingerprint
                 for issue in issues:
-                    fingerprint = BaseScanner.get_issue_fingerprint(issue)
+                    get = issue.get
+                    fingerprint = (get('tool', 'unknown-tool'), get('type', 'unknown-type'), get('file', 'unknown-file'), get('line', 0))
+                    try:
+                        hash(fingerprint)
+                    except TypeError:
+                        # Unhashable field values (e.g. a list of lines) use the string form
+                        fingerprint = BaseScanner.get_issue_fingerprint(issue)
                     if fingerprint not in seen_fingerprints:
                         seen_fingerprints.add(fingerprint)
                         all_issues.append(issue)
-                    else:
-                        logger.debug(f"UnifiedScanner: Deduplicating issue with fingerprint: {fingerprint}")
+                    elif logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"UnifiedScanner: Deduplicating issue with fingerprint: {BaseScanner.get_issue_fingerprint(issue)}")
 
             except (SlitherExecutionError, MythrilExecutionError, OyenteExecutionError, AderynExecutionError) as e:
                 logger.error(f"⚠️ {scanner.TOOL_NAME} scan failed: {e}")
@@ -133,8 +146,8 @@ class UnifiedScanner:
                 tool_status[scanner.TOOL_NAME] = "❌ Error"
                 # Continue with other scanners
 
-        # Log timing summary
-        total_time = sum(tool_timings.values())
+        # Log timing summary (total is wall time; tools overlap, so it is not their sum)
+        total_time = time.time() - run_start
         timing_str = ', '.join([f'{k}: {v:.2f}s' for k, v in tool_timings.items()]) if tool_timings else "No tools completed"
         logger.info(f"⏱️ Tool execution times: {timing_str}")
         
@@ -153,6 +166,25 @@ class UnifiedScanner:
         logger.info(f"🎯 UnifiedScanner: Completed in {total_time:.2f}s total. Found {len(all_issues)} total unique issues across all tools.")
         return all_issues, all_log_paths
 
+    async def _run_all(self, target_path: str, files: Optional[List[str]], config) -> List[Tuple[BaseScanner, Any, float]]:
+        """
+        Runs every enabled scanner at the same time, each in its own executor thread.
+
+        Returns:
+            One (scanner, result, elapsed seconds) tuple per scanner, in scanner order.
+            The result is the exception instead if that scanner raised.
+        """
+        async def run_one(scanner: BaseScanner) -> Tuple[BaseScanner, Any, float]:
+            logger.info(f"📌 Running {scanner.TOOL_NAME}...")
+            start_time = time.time()
+            try:
+                result = await scanner.run_async(target_path, files=files, config=config)
+            except Exception as e:
+                result = e
+            return scanner, result, time.time() - start_time
+
+        return await asyncio.gather(*(run_one(scanner) for scanner in self.scanners))
+
     def get_tools_used(self) -> List[str]:
         """
         Returns the list of tools used in the last scan.
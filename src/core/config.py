@@ -32,6 +32,15 @@ class ScanConfig(BaseModel):
         default_factory=lambda: ["slither", "mythril"],
         description="List of security analysis tools to run. Options: slither, mythril, aderyn, oyente"
     )
+    max_concurrent_scans: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of per-file processes each tool runs in parallel. Defaults to the CPU count. All tools together are also capped by MAX_TOOL_PROCESSES per worker process."
+    )
+    keep_raw_issues: bool = Field(
+        default=False,
+        description="Attach each tool's original finding to reported issues as raw_data (for debugging)"
+    )
 
     def get_min_severity(self) -> str:
         """Returns the minimum severity level as a string."""
@@ -2,11 +2,23 @@ import time
 import jwt
 import requests
 import logging
+from pathlib import Path
 from typing import Optional, Dict, Any
+from src.core.github_session import github_session
 from src.config import settings # Assuming settings.GITHUB_APP_ID and GITHUB_PRIVATE_KEY_PATH exist
 
 logger = logging.getLogger(__name__)
 
+# Process-wide JWT cache so repeated tasks in the same worker skip RSA signing.
+# The app JWT is valid for 10 minutes, so it is reused for 9.
+_JWT_CACHE: Dict[str, Any] = {"token": None, "exp": 0}
+# Installation access tokens are valid for an hour. GitHubAuth is built per task, so the
+# cache lives at module level to let later tasks skip the access-token round-trip.
+# Format: {installation_id: {'token': '...', 'expires_at': timestamp}}
+_INSTALLATION_TOKEN_CACHE: Dict[int, Dict[str, Any]] = {}
+JWT_TTL_SECONDS = 9 * 60
+JWT_REFRESH_MARGIN_SECONDS = 60
+
 class GitHubAuth:
     """
     Handles generation of JWTs and fetching temporary Installation Access Tokens
@@ -17,26 +29,34 @@ class GitHubAuth:
         # Configuration setup (ensure these settings exist in your .env/config)
         self.app_id = settings.GITHUB_APP_ID
         self.private_key = self._load_private_key(settings.GITHUB_PRIVATE_KEY_PATH)
-        self.token_cache: Dict[int, Dict[str, Any]] = {} # Cache format: {installation_id: {'token': '...', 'expires_at': timestamp}}
+        self.token_cache: Dict[int, Dict[str, Any]] = _INSTALLATION_TOKEN_CACHE
 
-    def _load_private_key(self, path: str) -> str:
-        """Loads the private key content from the specified file path."""
+    def _load_private_key(self, path: Path):
+        """
+        Returns the deserialized private key. Settings reads and parses the PEM once
+        per process, so repeated GitHubAuth instances do no disk I/O.
+        """
         try:
-            with open(path, 'r') as f:
-                return f.read()
+            return settings.github_signing_key
         except FileNotFoundError:
             logger.critical(f"Private key file not found at: {path}")
             raise
 
     def _generate_jwt(self) -> str:
-        """Generates a signed JWT valid for 10 minutes."""
+        """
+        Returns a signed app JWT, reusing the cached one until it is about to expire.
+        GitHub accepts JWTs valid for at most 10 minutes; we issue them for 9.
+        """
         now = int(time.time())
-        
+        if _JWT_CACHE["token"] and _JWT_CACHE["exp"] - now > JWT_REFRESH_MARGIN_SECONDS:
+            return _JWT_CACHE["token"]
+
+        exp = now + JWT_TTL_SECONDS
         payload = {
-            # issued at time
-            'iat': now,
+            # issued at time (backdated to tolerate clock drift)
+            'iat': now - 60,
             # JWT expiration time (10 minutes maximum)
-            'exp': now + (10 * 60),
+            'exp': exp,
             # GitHub App's identifier
             'iss': self.app_id
         }
@@ -47,6 +67,8 @@ class GitHubAuth:
             self.private_key,
             algorithm='RS256'
         )
+        _JWT_CACHE["token"] = encoded_jwt
+        _JWT_CACHE["exp"] = exp
         return encoded_jwt
 
     def get_installation_token(self, installation_id: int) -> Optional[str]:
@@ -71,7 +93,7 @@ class GitHubAuth:
         token_url = f"https://api.github.com/app/installations/{installation_id}/access_tokens"
         
         try:
-            response = requests.post(token_url, headers=headers)
+            response = github_session.post(token_url, headers=headers)
             response.raise_for_status()
             token_data = response.json()
             
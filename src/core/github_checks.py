@@ -16,6 +16,7 @@ import logging
 import requests
 from typing import Dict, Any, List, Optional, Literal
 from datetime import datetime, timezone
+from src.core.github_session import github_session
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ class GitHubChecksManager:
             }
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = github_session.post(url, headers=self.headers, json=payload)
             response.raise_for_status()
             
             check_run_id = response.json().get("id")
@@ -163,7 +164,7 @@ class GitHubChecksManager:
         }
         
         try:
-            response = requests.patch(url, headers=self.headers, json=payload)
+            response = github_session.patch(url, headers=self.headers, json=payload)
             response.raise_for_status()
             
             logger.info(f"✅ Completed check run {check_run_id} with conclusion: {conclusion}")
@@ -2,6 +2,7 @@ import requests
 import logging
 import os
 from typing import List, Dict, Any, Optional
+from src.core.github_session import github_session
 
 logger = logging.getLogger(__name__)
 
@@ -179,7 +180,7 @@ class GitHubReporter:
         data = {"body": markdown_body}
 
         try:
-            response = requests.post(self.base_url, headers=self.headers, json=data)
+            response = github_session.post(self.base_url, headers=self.headers, json=data)
             response.raise_for_status() 
             logger.info(f"✅ Report posted successfully to {self.base_url}")
             return response.json()
@@ -241,7 +242,7 @@ class GitHubReporter:
         """
         data = {"body": body}
         try:
-            response = requests.post(self.base_url, headers=self.headers, json=data)
+            response = github_session.post(self.base_url, headers=self.headers, json=data)
             response.raise_for_status()
             logger.info(f"✅ Comment posted successfully to {self.base_url}")
             return response.json()
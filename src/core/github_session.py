@@ -0,0 +1,46 @@
+"""
+Shared HTTP session for synchronous GitHub API calls.
+
+GitHubAuth, GitHubChecksManager and GitHubReporter are created per scan task;
+routing their requests through one module-level session lets urllib3 reuse
+TCP+TLS connections to api.github.com across calls instead of handshaking
+on every request.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool sizing for api.github.com
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Seconds to wait for a connection or a response when a call sets no timeout itself;
+# requests waits forever by default, which would hang the scan task on a stalled socket
+DEFAULT_TIMEOUT = 10.0
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_TIMEOUT to requests sent without a timeout."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def _build_session() -> requests.Session:
+    """
+    Creates a session with a pooled adapter, a default timeout and light retry/backoff
+    for transient failures.
+    """
+    session = requests.Session()
+    adapter = _TimeoutHTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+github_session = _build_session()
@@ -1,5 +1,5 @@
 import redis
-import json
+import orjson
 import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -7,6 +7,10 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Each baseline / scan result is stored as one JSON blob so a read is a single GET.
+# Non-string dict keys are stringified, matching json.dumps.
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 class RedisClient:
     """
     A client for interacting with Redis to store and retrieve security baselines
@@ -39,7 +43,7 @@ class RedisClient:
             return
 
         try:
-            serialized_issues = json.dumps(issues)
+            serialized_issues = orjson.dumps(issues, option=_DUMPS_OPTIONS)
             self.client.set(key, serialized_issues)
             logger.info(f"💾 Saved baseline for '{key}' with {len(issues)} issues.")
         except Exception as e:
@@ -62,7 +66,7 @@ class RedisClient:
         try:
             serialized_issues = self.client.get(key)
             if serialized_issues:
-                issues = json.loads(serialized_issues)
+                issues = orjson.loads(serialized_issues)
                 logger.info(f"✅ Loaded baseline for '{key}' with {len(issues)} issues.")
                 return issues
             else:
@@ -90,7 +94,7 @@ class RedisClient:
         try:
             key = f"scan_result:{repo_owner}:{repo_name}"
             scan_result["saved_at"] = datetime.utcnow().isoformat()
-            serialized = json.dumps(scan_result)
+            serialized = orjson.dumps(scan_result, option=_DUMPS_OPTIONS)
             self.client.setex(key, ttl_seconds, serialized)
             logger.info(f"💾 Saved scan result for '{repo_owner}/{repo_name}'")
             return True
@@ -117,7 +121,7 @@ class RedisClient:
             key = f"scan_result:{repo_owner}:{repo_name}"
             serialized = self.client.get(key)
             if serialized:
-                result = json.loads(serialized)
+                result = orjson.loads(serialized)
                 logger.info(f"✅ Loaded scan result for '{repo_owner}/{repo_name}'")
                 return result
             else:
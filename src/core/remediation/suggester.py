@@ -70,8 +70,8 @@ class RemediationSuggester:
         """
         self.stats["total_processed"] += 1
         
-        # Create a copy to avoid mutating original
-        enriched = issue.copy()
+        # Create a dict copy to avoid mutating original (scanners may emit Issue objects)
+        enriched = dict(issue)
         
         # Get the tool and issue type
         tool = issue.get("tool", "").lower()
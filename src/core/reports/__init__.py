@@ -12,10 +12,12 @@ from src.core.reports.pdf_generator import (
     PreAuditReportGenerator,
     ReportData,
     IssuesSummary,
+    count_issue_severities,
 )
 
 __all__ = [
     "PreAuditReportGenerator",
     "ReportData",
     "IssuesSummary",
+    "count_issue_severities",
 ]
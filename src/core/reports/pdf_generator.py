@@ -11,7 +11,7 @@ external dependencies like wkhtmltopdf.
 import io
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, BinaryIO
 from dataclasses import dataclass, field
 
 from reportlab.lib import colors
@@ -28,6 +28,24 @@ from reportlab.graphics.charts.piecharts import Pie
 
 logger = logging.getLogger(__name__)
 
+SEVERITY_BUCKETS = ("critical", "high", "medium", "low", "informational")
+
+
+def count_issue_severities(issues: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Counts issues per lowercase severity bucket; unknown severities count as informational.
+    
+    Scan results store these counts at write time so report endpoints don't
+    re-walk every issue on each request.
+    """
+    counts = dict.fromkeys(SEVERITY_BUCKETS, 0)
+    for issue in issues:
+        severity = issue.get("severity", "informational")
+        if not severity.islower():
+            severity = severity.lower()
+        counts[severity if severity in counts else "informational"] += 1
+    return counts
+
 
 @dataclass
 class IssuesSummary:
@@ -199,9 +217,27 @@ class PreAuditReportGenerator:
             PDF content as bytes
         """
         buffer = io.BytesIO()
+        self.generate_to(data, buffer)
+        
+        pdf_content = buffer.getvalue()
+        buffer.close()
+        
+        logger.info(f"📄 Generated PDF report: {len(pdf_content)} bytes")
+        return pdf_content
+
+    def generate_to(self, data: ReportData, sink: BinaryIO) -> None:
+        """
+        Generate a PDF report and write it into a file-like sink.
+        
+        Lets callers stream the document (e.g. from a BytesIO) without
+        taking an extra copy of the rendered bytes.
         
+        Args:
+            data: ReportData containing scan results
+            sink: Writable binary file-like object
+        """
         doc = SimpleDocTemplate(
-            buffer,
+            sink,
             pagesize=self.page_size,
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
@@ -239,12 +275,6 @@ class PreAuditReportGenerator:
         
         # Build PDF
         doc.build(story)
-        
-        pdf_content = buffer.getvalue()
-        buffer.close()
-        
-        logger.info(f"📄 Generated PDF report: {len(pdf_content)} bytes")
-        return pdf_content
     
     def _build_header(self, data: ReportData) -> List:
         """Build the report header."""
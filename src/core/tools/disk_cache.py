@@ -0,0 +1,86 @@
+# src/core/tools/disk_cache.py
+import os, shutil, threading, time
+
+# Scanner result caches under ~/.cache/audit-pit-crew can be turned off entirely, e.g. on
+# ephemeral workers where nothing is ever re-scanned
+DISK_CACHE_ENABLED = os.environ.get("AUDIT_DISK_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Limits applied to each tool's cache directory when it is written to: entries older than
+# the age limit are removed, then the oldest ones until the directory fits the size cap
+DISK_CACHE_MAX_BYTES = int(os.environ.get("AUDIT_DISK_CACHE_MAX_MB", "512")) * 1024 * 1024
+DISK_CACHE_MAX_AGE_SECONDS = int(os.environ.get("AUDIT_DISK_CACHE_MAX_AGE_DAYS", "30")) * 24 * 3600
+
+# Pruning walks the whole directory, so each process does it at most this often per cache
+PRUNE_INTERVAL_SECONDS = 60
+
+_last_pruned = {}
+_prune_lock = threading.Lock()
+
+def write_entry(cache_root, cache_path, data=None, source_path=None):
+    # Writes data (or a copy of source_path) to a per-thread temp file renamed into place,
+    # so concurrent readers never see a partial entry, then prunes cache_root.
+    # Raises OSError if the entry cannot be written.
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    try:
+        if data is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        else:
+            shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    prune(cache_root)
+
+def prune(cache_root, force=False):
+    # Removes expired entries, then the oldest ones while cache_root exceeds the size cap.
+    # Errors are ignored: another worker may be pruning the same directory.
+    now = time.time()
+    with _prune_lock:
+        if not force and now - _last_pruned.get(cache_root, 0) < PRUNE_INTERVAL_SECONDS:
+            return
+        _last_pruned[cache_root] = now
+
+    entries = []
+    pending = [cache_root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            entries.append((st.st_mtime, st.st_size, entry.path))
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+    total = 0
+    kept = []
+    for mtime, size, path in entries:
+        if now - mtime > DISK_CACHE_MAX_AGE_SECONDS:
+            _remove(path)
+        else:
+            kept.append((mtime, size, path))
+            total += size
+
+    kept.sort()
+    for mtime, size, path in kept:
+        if total <= DISK_CACHE_MAX_BYTES:
+            break
+        _remove(path)
+        total -= size
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,19 +1,56 @@
 # src/core/tools/run_tool.py
-import subprocess, tempfile, json, os
-
-def run_tool(cmd, cwd=None, timeout=600):
-    outf = tempfile.NamedTemporaryFile(delete=False)
-    errf = tempfile.NamedTemporaryFile(delete=False)
-    try:
-        rc = subprocess.call(cmd, cwd=cwd, stdout=open(outf.name,'wb'), stderr=open(errf.name,'wb'), timeout=timeout)
-    except Exception as e:
-        rc = 255
-        open(errf.name,'a').write(str(e))
-    stdout = open(outf.name,'rb').read()
-    stderr = open(errf.name,'rb').read()
+import subprocess, tempfile, os, re, threading
+
+import orjson
+
+# Exit code reported when the tool is killed for exceeding its timeout (as GNU timeout)
+TIMEOUT_EXIT_CODE = 124
+
+# Cap on tool processes running at once in this worker process. UnifiedScanner runs all
+# tools together and each sizes its own per-file pool, so every run_tool call draws from
+# this one budget. With several worker processes per host, set it to CPUs / workers.
+MAX_TOOL_PROCESSES = int(os.environ.get("MAX_TOOL_PROCESSES") or os.cpu_count() or 1)
+_process_slots = threading.BoundedSemaphore(MAX_TOOL_PROCESSES)
+
+# Leading whitespace followed by the start of a JSON object or array
+_JSON_START = re.compile(rb'\s*[\[{]')
+
+def run_tool(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+    # Output goes straight to temp files rather than pipes, so nothing is copied through
+    # Python while the tool runs; the files stay on disk as the run's logs
+    with tempfile.NamedTemporaryFile(delete=False) as outf, tempfile.NamedTemporaryFile(delete=False) as errf:
+        try:
+            # The timeout starts once a slot is free, so queued calls are not cut short
+            with _process_slots:
+                rc = subprocess.call(cmd, cwd=cwd, stdout=outf, stderr=errf, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            # subprocess.call has already killed the child
+            rc = TIMEOUT_EXIT_CODE
+            errf.write(str(e).encode())
+        except Exception as e:
+            rc = 255
+            errf.write(str(e).encode())
+    # Callers that can stream a large output from out_path pass max_stdout_bytes; above
+    # it stdout is returned as None instead of being read into memory
+    if max_stdout_bytes is not None and os.path.getsize(outf.name) > max_stdout_bytes:
+        stdout = None
+    else:
+        with open(outf.name, 'rb') as f:
+            stdout = f.read()
+    with open(errf.name, 'rb') as f:
+        stderr = f.read()
     return rc, stdout, stderr, outf.name, errf.name
 
+def is_blank(data):
+    # isspace() checks the bytes in place instead of copying a stripped output
+    return not data or data.isspace()
+
+def looks_like_json(data):
+    # Cheap prefix check so obvious error text is never handed to a JSON parser
+    return _JSON_START.match(data) is not None
+
 def parse_json_output(stdout_bytes):
     if not stdout_bytes.strip():
         raise ValueError("No stdout")
-    return json.loads(stdout_bytes)
+    # orjson parses the captured bytes directly, without a str decode first
+    return orjson.loads(stdout_bytes)
@@ -0,0 +1,21 @@
+# src/core/tools/solc_select.py
+import os
+
+# solc-select's state directory (it honors VIRTUAL_ENV the same way): the selected
+# version lives in global-version, installed compilers under artifacts/
+SOLC_SELECT_DIR = os.path.join(os.environ.get("VIRTUAL_ENV") or os.path.expanduser("~"), ".solc-select")
+
+def global_version_path():
+    return os.path.join(SOLC_SELECT_DIR, "global-version")
+
+def artifact_path(version):
+    return os.path.join(SOLC_SELECT_DIR, "artifacts", f"solc-{version}", f"solc-{version}")
+
+def read_global_version():
+    # The version the solc shim compiles with, or None if none is selected. Read on every
+    # call, since Slither may switch it between scans.
+    try:
+        with open(global_version_path(), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
@@ -14,6 +14,7 @@ from src.core.github_auth import GitHubAuth
 from src.core.config import AuditConfigManager
 from src.core.redis_client import RedisClient
 from src.core.remediation import RemediationSuggester
+from src.core.reports import count_issue_severities
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +159,7 @@ def scan_repo_task(self, repo_url: str, pr_context: Dict[str, Any] = None, **kwa
                 "commit_sha": head_sha,
                 "pr_number": pr_number,
                 "issues": enriched_issues,
+                "severity_counts": count_issue_severities(enriched_issues),
                 "tools_used": scanner.get_tools_used(),
                 "files_scanned": len(changed_solidity_files),
                 "scan_type": "differential",
@@ -222,6 +224,7 @@ def scan_repo_task(self, repo_url: str, pr_context: Dict[str, Any] = None, **kwa
                     "branch": "main",
                     "commit_sha": "HEAD",
                     "issues": baseline_issues,
+                    "severity_counts": count_issue_severities(baseline_issues),
                     "tools_used": scanner.get_tools_used(),
                     "files_scanned": 0,  # Full scan, count not tracked
                     "scan_type": "baseline",
@@ -0,0 +1,81 @@
+"""
+Unit tests for AderynScanner issue conversion and severity filtering.
+"""
+from unittest.mock import patch
+
+import orjson
+
+from src.core.analysis import aderyn_scanner
+from src.core.analysis.aderyn_scanner import AderynScanner
+from src.core.config import AuditConfig, ScanConfig
+
+
+RAW_ISSUES = [
+    {"title": "low-check", "severity": "low", "file": "/repo/src/A.sol", "line": 1},
+    {"title": "high-check", "severity": "High", "file": "/repo/src/B.sol", "line": 2},
+    {"title": "info-check", "severity": "info", "file": "src/C.sol", "line": 3},
+    {"title": "critical-check", "severity": "CRITICAL", "file": "/repo/src/D.sol", "line": 4},
+]
+
+
+def run_scanner(config=None):
+    with patch.object(AderynScanner, "_execute_aderyn", return_value=RAW_ISSUES):
+        return AderynScanner().run("/repo", config=config)
+
+
+class TestAderynRun:
+    """Test AderynScanner.run conversion and filtering."""
+
+    def test_default_keeps_all_ordered_by_severity(self):
+        result = run_scanner()
+
+        assert [i["type"] for i in result] == ["critical-check", "high-check", "low-check", "info-check"]
+        assert [i["severity"] for i in result] == ["Critical", "High", "Low", "Low"]
+
+    def test_paths_are_relative_to_target(self):
+        result = run_scanner()
+
+        assert {i["file"] for i in result} == {"src/A.sol", "src/B.sol", "src/C.sol", "src/D.sol"}
+
+    def test_min_severity_from_scan_config(self):
+        result = run_scanner(ScanConfig(min_severity="High"))
+
+        assert [i["type"] for i in result] == ["critical-check", "high-check"]
+
+    def test_min_severity_from_audit_config(self):
+        result = run_scanner(AuditConfig(scan=ScanConfig(min_severity="Critical")))
+
+        assert [i["type"] for i in result] == ["critical-check"]
+
+    def test_issues_behave_like_dicts(self):
+        issue = run_scanner()[0]
+
+        assert issue["file"] == "src/D.sol"
+        assert issue.get("swc_id") == ""
+        assert orjson.loads(orjson.dumps(issue)) == dict(issue)
+
+    def test_repeated_findings_are_deduplicated(self):
+        repeated = RAW_ISSUES + [dict(RAW_ISSUES[1], description="second hit")]
+        with patch.object(AderynScanner, "_execute_aderyn", return_value=repeated):
+            result = AderynScanner().run("/repo")
+
+        assert [i["type"] for i in result].count("high-check") == 1
+
+
+class TestAderynReportFile:
+    """Test reading Aderyn's report file when stdout carries no JSON."""
+
+    def execute(self, tmp_path, threshold=aderyn_scanner.STREAM_THRESHOLD_BYTES):
+        with patch.object(aderyn_scanner, "ADERYN_BIN", "aderyn"), \
+                patch.object(aderyn_scanner, "STREAM_THRESHOLD_BYTES", threshold), \
+                patch.object(aderyn_scanner, "run_tool", return_value=(0, b"Report written", b"", "o", "e")):
+            return list(AderynScanner()._execute_aderyn(str(tmp_path)))
+
+    def test_report_file_is_read(self, tmp_path):
+        (tmp_path / "aderyn_report.json").write_bytes(orjson.dumps({"issues": RAW_ISSUES}))
+
+        assert self.execute(tmp_path) == RAW_ISSUES
+        assert self.execute(tmp_path, threshold=0) == RAW_ISSUES
+
+    def test_missing_report_file_means_no_issues(self, tmp_path):
+        assert self.execute(tmp_path) == []
@@ -32,6 +32,14 @@ class TestScanConfigDefaults:
         config = ScanConfig()
         assert config.enabled_tools == ["slither", "mythril"]
 
+    def test_default_max_concurrent_scans(self):
+        config = ScanConfig()
+        assert config.max_concurrent_scans is None
+
+    def test_default_keep_raw_issues(self):
+        config = ScanConfig()
+        assert config.keep_raw_issues is False
+
 
 class TestAuditConfigManagerLoadConfig:
     """Test AuditConfigManager.load_config behavior."""
@@ -0,0 +1,53 @@
+"""
+Unit tests for the scanner result-cache pruning.
+"""
+import os
+import time
+
+import pytest
+
+from src.core.tools import disk_cache
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "_last_pruned", {})
+    return tmp_path / "cache"
+
+
+def write_aged(cache_root, name, size, age_seconds):
+    path = cache_root / "v1" / name
+    disk_cache.write_entry(str(cache_root), str(path), b"x" * size)
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestPrune:
+    """Test that cache directories stay within their age and size limits."""
+
+    def test_expired_entries_are_removed(self, cache_root, monkeypatch):
+        monkeypatch.setattr(disk_cache, "DISK_CACHE_MAX_AGE_SECONDS", 3600)
+        old = write_aged(cache_root, "old.json", 10, 7200)
+        fresh = write_aged(cache_root, "fresh.json", 10, 60)
+
+        disk_cache.prune(str(cache_root), force=True)
+
+        assert not old.exists()
+        assert fresh.exists()
+
+    def test_oldest_entries_removed_above_size_cap(self, cache_root, monkeypatch):
+        monkeypatch.setattr(disk_cache, "DISK_CACHE_MAX_BYTES", 250)
+        paths = [write_aged(cache_root, f"{i}.json", 100, 300 - i) for i in range(3)]
+
+        disk_cache.prune(str(cache_root), force=True)
+
+        assert [p.exists() for p in paths] == [False, True, True]
+
+    def test_write_prunes_at_most_once_per_interval(self, cache_root, monkeypatch):
+        monkeypatch.setattr(disk_cache, "DISK_CACHE_MAX_BYTES", 150)
+        first = write_aged(cache_root, "a.json", 100, 10)
+        write_aged(cache_root, "b.json", 100, 0)
+
+        # The first write pruned; the second is inside the interval and leaves both
+        assert first.exists()
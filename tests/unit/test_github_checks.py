@@ -33,7 +33,7 @@ class TestCreateCheckRun:
     def test_create_check_run_success(self):
         manager = GitHubChecksManager("token", "owner", "repo")
         
-        with patch('requests.post') as mock_post:
+        with patch('src.core.github_checks.github_session.post') as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = {"id": 12345}
             mock_response.raise_for_status = MagicMock()
@@ -49,7 +49,7 @@ class TestCreateCheckRun:
     def test_create_check_run_failure(self):
         manager = GitHubChecksManager("token", "owner", "repo")
         
-        with patch('requests.post') as mock_post:
+        with patch('src.core.github_checks.github_session.post') as mock_post:
             mock_post.side_effect = Exception("API Error")
             
             check_run_id = manager.create_check_run(head_sha="abc123")
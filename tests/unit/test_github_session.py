@@ -0,0 +1,20 @@
+"""
+Unit tests for the shared GitHub API session.
+"""
+from unittest.mock import MagicMock, patch
+
+from requests.adapters import HTTPAdapter
+
+from src.core.github_session import DEFAULT_TIMEOUT, github_session
+
+
+class TestGitHubSession:
+    """Test the session's default timeout."""
+
+    def test_default_timeout_applied_unless_given(self):
+        response = MagicMock(is_redirect=False, headers={})
+        with patch.object(HTTPAdapter, "send", return_value=response) as send:
+            github_session.get("https://api.github.com/app")
+            github_session.get("https://api.github.com/app", timeout=3)
+
+        assert [c.kwargs["timeout"] for c in send.call_args_list] == [DEFAULT_TIMEOUT, 3]
@@ -0,0 +1,84 @@
+"""
+Unit tests for MythrilScanner per-file execution and the source-closure result cache.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core.analysis import mythril_scanner
+from src.core.analysis.base_scanner import MythrilExecutionError
+from src.core.analysis.mythril_scanner import MythrilScanner
+
+
+def fake_execute(target_path, relative_files=None):
+    file_path = relative_files[0]
+    if file_path == "src/Slow.sol":
+        raise MythrilExecutionError("Mythril Scan Failed. Timed out")
+    issue = {"title": "Reentrancy", "severity": "High", "sourceMap": "400:10:0"}
+    return {"issues": [issue], "scanned_files": relative_files}
+
+
+class TestMythrilPerFile:
+    """Test per-file execution for differential scans."""
+
+    def test_failing_file_keeps_other_results(self):
+        files = ["/repo/src/A.sol", "/repo/src/Slow.sol", "/repo/src/B.sol"]
+        with patch.object(MythrilScanner, "_execute_mythril", side_effect=fake_execute):
+            issues = MythrilScanner().run("/repo", files=files)
+
+        assert [i["file"] for i in issues] == ["src/A.sol", "src/B.sol"]
+
+    def test_all_files_failing_raises(self):
+        files = ["/repo/src/Slow.sol", "/repo/src/Slow.sol"]
+        with patch.object(MythrilScanner, "_execute_mythril", side_effect=fake_execute):
+            with pytest.raises(MythrilExecutionError):
+                MythrilScanner().run("/repo", files=files)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(mythril_scanner, "MYTHRIL_CACHE_DIR", str(tmp_path / "cache"))
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "node_modules" / "@oz").mkdir(parents=True)
+    (root / "node_modules" / "@oz" / "Base.sol").write_text("contract Base {}")
+    (root / "src" / "Lib.sol").write_text('import "@oz/Base.sol";\ncontract Lib is Base {}')
+    (root / "src" / "A.sol").write_text('import {Lib} from "./Lib.sol";\ncontract A is Lib {}')
+    return root
+
+
+def scan(root, file_name="A.sol"):
+    with patch.object(MythrilScanner, "_execute_mythril", side_effect=fake_execute) as execute:
+        issues = MythrilScanner().run(str(root), files=[str(root / "src" / file_name)])
+    return issues, execute.call_count
+
+
+class TestMythrilCache:
+    """Test the per-file cache keyed by a file and the sources it imports."""
+
+    def test_unchanged_file_reuses_result(self, repo):
+        first, _ = scan(repo)
+        second, calls = scan(repo)
+
+        assert calls == 0
+        assert second == first
+
+    def test_changed_import_is_rescanned(self, repo):
+        scan(repo)
+        (repo / "node_modules" / "@oz" / "Base.sol").write_text("contract Base { uint x; }")
+        _, calls = scan(repo)
+
+        assert calls == 1
+
+    def test_unresolved_import_is_not_cached(self, repo):
+        (repo / "src" / "A.sol").write_text('import "forge-std/Test.sol";\ncontract A {}')
+        scan(repo)
+        _, calls = scan(repo)
+
+        assert calls == 1
+
+    def test_failed_scan_is_not_cached(self, repo):
+        (repo / "src" / "Slow.sol").write_text("contract Slow {}")
+        for _ in range(2):
+            with pytest.raises(MythrilExecutionError):
+                scan(repo, "Slow.sol")
@@ -0,0 +1,119 @@
+"""
+Unit tests for OyenteScanner issue conversion and the source-closure result cache.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.core.analysis import oyente_scanner
+from src.core.analysis.oyente_scanner import OyenteScanner
+from src.core.config import ScanConfig
+
+
+OYENTE_OUTPUT = {
+    "issues": [
+        {"title": "Integer Overflow", "severity": "Warning", "line": 7},
+        {"title": "Timestamp Dependency", "severity": "info", "line": 12},
+        {"title": "Reentrancy", "severity": "HIGH", "line": 20},
+    ]
+}
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(oyente_scanner, "OYENTE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(oyente_scanner, "_oyente_version", "0.2.7")
+    monkeypatch.setattr(oyente_scanner.solc_select, "SOLC_SELECT_DIR", str(tmp_path / "solc-select"))
+    monkeypatch.delenv("SOLC_VERSION", raising=False)
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "A.sol").write_text("contract A {}")
+    (root / "src" / "B.sol").write_text("contract A {}")
+    (root / "src" / "C.sol").write_text("contract C {}")
+    return root
+
+
+def run_scanner(root, config=None):
+    with patch.object(OyenteScanner, "_execute_oyente", return_value=OYENTE_OUTPUT) as execute:
+        result = OyenteScanner().run(str(root), config=config)
+    return result, execute
+
+
+class TestOyenteRun:
+    """Test OyenteScanner.run conversion and filtering."""
+
+    def test_severities_are_normalized(self, repo):
+        result, _ = run_scanner(repo, ScanConfig(max_concurrent_scans=1))
+
+        a_issues = [i for i in result if i["file"] == "src/A.sol"]
+        assert [i["severity"] for i in a_issues] == ["Medium", "Low", "High"]
+
+    def test_min_severity_from_scan_config(self, repo):
+        result, _ = run_scanner(repo, ScanConfig(min_severity="High", max_concurrent_scans=1))
+
+        assert {i["type"] for i in result} == {"Reentrancy"}
+
+    def test_repeated_findings_are_deduplicated(self, repo):
+        repeated = {"issues": OYENTE_OUTPUT["issues"] + [dict(OYENTE_OUTPUT["issues"][2], description="again")]}
+        with patch.object(OyenteScanner, "_execute_oyente", return_value=repeated):
+            result = OyenteScanner().run(str(repo), files=["src/C.sol"])
+
+        assert [i["type"] for i in result].count("Reentrancy") == 1
+
+
+class TestOyenteCache:
+    """Test the result cache keyed by a file, its imports and the compiler."""
+
+    def test_identical_files_run_oyente_once(self, repo):
+        # A.sol and B.sol share content, so only two of the three files reach Oyente
+        result, execute = run_scanner(repo, ScanConfig(max_concurrent_scans=1))
+
+        assert execute.call_count == 2
+        assert {i["file"] for i in result} == {"src/A.sol", "src/B.sol", "src/C.sol"}
+
+    def test_cache_is_reused_across_runs(self, repo):
+        run_scanner(repo)
+        _, execute = run_scanner(repo)
+
+        assert execute.call_count == 0
+
+    def test_changed_file_is_rescanned(self, repo):
+        run_scanner(repo)
+        (repo / "src" / "C.sol").write_text("contract C { uint x; }")
+        _, execute = run_scanner(repo)
+
+        assert execute.call_count == 1
+
+    def test_changed_import_is_rescanned(self, repo):
+        (repo / "src" / "Base.sol").write_text("contract Base {}")
+        (repo / "src" / "C.sol").write_text('import "./Base.sol";\ncontract C is Base {}')
+        run_scanner(repo)
+        (repo / "src" / "Base.sol").write_text("contract Base { uint x; }")
+        _, execute = run_scanner(repo)
+
+        # C.sol and Base.sol itself; A.sol and B.sol are unchanged
+        assert execute.call_count == 2
+
+    def test_unresolved_import_is_not_cached(self, repo):
+        (repo / "src" / "C.sol").write_text('import "forge-std/Test.sol";\ncontract C {}')
+        run_scanner(repo)
+        _, execute = run_scanner(repo)
+
+        assert execute.call_count == 1
+
+    def test_solc_switch_is_rescanned(self, repo, monkeypatch):
+        run_scanner(repo)
+        monkeypatch.setenv("SOLC_VERSION", "0.4.26")
+        _, execute = run_scanner(repo)
+
+        assert execute.call_count == 2
+
+    def test_solc_select_switch_is_rescanned(self, repo, tmp_path):
+        solc_select_dir = tmp_path / "solc-select"
+        solc_select_dir.mkdir()
+        (solc_select_dir / "global-version").write_text("0.8.20")
+        run_scanner(repo)
+        (solc_select_dir / "global-version").write_text("0.7.6")
+        _, execute = run_scanner(repo)
+
+        assert execute.call_count == 2
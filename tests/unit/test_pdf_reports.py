@@ -200,80 +200,111 @@ class TestAPIEndpoints:
         from src.api.main import app
         return TestClient(app)
 
-    def test_get_pdf_no_scan_results(self, test_client):
+    @pytest.fixture
+    def mock_client(self):
+        """Override the shared Redis dependency with a mock."""
+        from src.api.main import app
+        from src.api.dependencies import get_redis
+        mock_client = MagicMock()
+        app.dependency_overrides[get_redis] = lambda: mock_client
+        yield mock_client
+        app.dependency_overrides.pop(get_redis, None)
+
+    def test_get_pdf_no_scan_results(self, test_client, mock_client):
         """Test PDF endpoint returns 404 when no scan results exist."""
-        with patch('src.api.main.RedisClient') as mock_redis_class:
-            mock_client = MagicMock()
-            mock_client.get_scan_result.return_value = None
-            mock_redis_class.return_value = mock_client
-            
-            response = test_client.get("/api/reports/nonexistent/repo/pdf")
-            assert response.status_code == 404
-            assert "No scan results found" in response.json()["detail"]
+        mock_client.get_scan_result.return_value = None
+        
+        response = test_client.get("/api/reports/nonexistent/repo/pdf")
+        assert response.status_code == 404
+        assert "No scan results found" in response.json()["detail"]
 
-    def test_get_summary_no_scan_results(self, test_client):
+    def test_get_summary_no_scan_results(self, test_client, mock_client):
         """Test summary endpoint returns 404 when no scan results exist."""
-        with patch('src.api.main.RedisClient') as mock_redis_class:
-            mock_client = MagicMock()
-            mock_client.get_scan_result.return_value = None
-            mock_redis_class.return_value = mock_client
-            
-            response = test_client.get("/api/reports/nonexistent/repo/summary")
-            assert response.status_code == 404
+        mock_client.get_scan_result.return_value = None
+        
+        response = test_client.get("/api/reports/nonexistent/repo/summary")
+        assert response.status_code == 404
 
-    def test_get_summary_with_results(self, test_client):
+    def test_get_summary_with_results(self, test_client, mock_client):
         """Test summary endpoint returns correct data."""
-        with patch('src.api.main.RedisClient') as mock_redis_class:
-            mock_client = MagicMock()
-            mock_client.get_scan_result.return_value = {
-                "saved_at": "2024-01-15T10:30:00",
-                "scan_type": "differential",
-                "branch": "feature/test",
-                "commit_sha": "abc123",
-                "tools_used": ["Slither", "Mythril"],
-                "files_scanned": 5,
-                "issues": [
-                    {"severity": "high", "title": "Issue 1"},
-                    {"severity": "medium", "title": "Issue 2"},
-                    {"severity": "low", "title": "Issue 3"},
-                ],
-            }
-            mock_redis_class.return_value = mock_client
-            
-            response = test_client.get("/api/reports/test-org/test-repo/summary")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["repository"] == "test-org/test-repo"
-            assert data["clearance_status"] == "FAILED"  # Has high severity
-            assert data["issues"]["total"] == 3
-            assert data["issues"]["by_severity"]["high"] == 1
-            assert data["issues"]["blocking"] == 1
-
-    def test_get_summary_clearance_passed(self, test_client):
+        mock_client.get_scan_result.return_value = {
+            "saved_at": "2024-01-15T10:30:00",
+            "scan_type": "differential",
+            "branch": "feature/test",
+            "commit_sha": "abc123",
+            "tools_used": ["Slither", "Mythril"],
+            "files_scanned": 5,
+            "issues": [
+                {"severity": "high", "title": "Issue 1"},
+                {"severity": "medium", "title": "Issue 2"},
+                {"severity": "low", "title": "Issue 3"},
+            ],
+        }
+        
+        response = test_client.get("/api/reports/test-org/test-repo/summary")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["repository"] == "test-org/test-repo"
+        assert data["clearance_status"] == "FAILED"  # Has high severity
+        assert data["issues"]["total"] == 3
+        assert data["issues"]["by_severity"]["high"] == 1
+        assert data["issues"]["blocking"] == 1
+
+    def test_get_summary_clearance_passed(self, test_client, mock_client):
         """Test summary shows PASSED when no blocking issues."""
-        with patch('src.api.main.RedisClient') as mock_redis_class:
-            mock_client = MagicMock()
-            mock_client.get_scan_result.return_value = {
-                "saved_at": "2024-01-15T10:30:00",
-                "scan_type": "baseline",
-                "branch": "main",
-                "commit_sha": "def456",
-                "tools_used": ["Slither"],
-                "files_scanned": 3,
-                "issues": [
-                    {"severity": "medium", "title": "Issue 1"},
-                    {"severity": "low", "title": "Issue 2"},
-                ],
-            }
-            mock_redis_class.return_value = mock_client
-            
-            response = test_client.get("/api/reports/test-org/clean-repo/summary")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["clearance_status"] == "PASSED"
-            assert data["issues"]["blocking"] == 0
+        mock_client.get_scan_result.return_value = {
+            "saved_at": "2024-01-15T10:30:00",
+            "scan_type": "baseline",
+            "branch": "main",
+            "commit_sha": "def456",
+            "tools_used": ["Slither"],
+            "files_scanned": 3,
+            "issues": [
+                {"severity": "medium", "title": "Issue 1"},
+                {"severity": "low", "title": "Issue 2"},
+            ],
+        }
+        
+        response = test_client.get("/api/reports/test-org/clean-repo/summary")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["clearance_status"] == "PASSED"
+        assert data["issues"]["blocking"] == 0
+
+    def test_get_summary_normalizes_severity_case(self, test_client, mock_client):
+        """Test mixed-case and unknown severities are bucketed correctly."""
+        mock_client.get_scan_result.return_value = {
+            "saved_at": "2024-01-15T10:30:00",
+            "issues": [
+                {"severity": "Critical", "title": "Issue 1"},
+                {"severity": "HIGH", "title": "Issue 2"},
+                {"severity": "Unknown", "title": "Issue 3"},
+                {"title": "Issue 4"},
+            ],
+        }
+
+        response = test_client.get("/api/reports/test-org/test-repo/summary")
+
+        by_severity = response.json()["issues"]["by_severity"]
+        assert by_severity["critical"] == 1
+        assert by_severity["high"] == 1
+        assert by_severity["informational"] == 2
+
+    def test_get_summary_uses_stored_severity_counts(self, test_client, mock_client):
+        """Test counts persisted at scan time are used instead of recounting."""
+        mock_client.get_scan_result.return_value = {
+            "saved_at": "2024-01-15T10:30:00",
+            "issues": [{"severity": "Medium", "title": "Issue 1"}],
+            "severity_counts": {"critical": 0, "high": 2, "medium": 1, "low": 0, "informational": 0},
+        }
+
+        response = test_client.get("/api/reports/test-org/test-repo/summary")
+
+        data = response.json()
+        assert data["issues"]["by_severity"]["high"] == 2
+        assert data["clearance_status"] == "FAILED"
 
 
 class TestUnifiedScannerToolsUsed:
@@ -0,0 +1,37 @@
+"""
+Unit tests for run_tool's shared process budget.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from src.core.tools import run_tool as run_tool_module
+from src.core.tools.run_tool import run_tool
+
+
+class TestProcessBudget:
+    """Test that concurrent run_tool calls share one process budget."""
+
+    def test_concurrent_calls_are_capped(self, monkeypatch):
+        monkeypatch.setattr(run_tool_module, "_process_slots", threading.BoundedSemaphore(2))
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_call(cmd, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return 0
+
+        with patch.object(run_tool_module.subprocess, "call", side_effect=fake_call):
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                results = list(pool.map(lambda _: run_tool(["tool"]), range(6)))
+
+        assert peak == 2
+        assert [r[0] for r in results] == [0] * 6
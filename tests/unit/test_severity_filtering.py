@@ -1,9 +1,11 @@
 """
-Unit tests for BaseScanner severity filtering.
+Unit tests for BaseScanner severity filtering and raw_data handling.
 """
+import orjson
 import pytest
 
 from src.core.analysis.base_scanner import BaseScanner
+from src.core.config import AuditConfig, ScanConfig
 
 
 class DummyScanner(BaseScanner):
@@ -26,6 +28,21 @@ class TestSeverityMapping:
         assert scanner.SEVERITY_MAP['critical'] == 4
 
 
+class TestSeverityThreshold:
+    """Test _severity_threshold method."""
+
+    def test_threshold_resolves_any_casing(self):
+        scanner = DummyScanner()
+
+        assert scanner._severity_threshold("High") == scanner._severity_threshold("HIGH") == 3
+
+    def test_threshold_ignores_overridden_severity_map(self):
+        class LabelScanner(DummyScanner):
+            SEVERITY_MAP = {'high': 'High', 'low': 'Low'}
+
+        assert LabelScanner()._severity_threshold("Medium") == 2
+
+
 class TestFilterBySeverity:
     """Test _filter_by_severity method."""
 
@@ -40,7 +57,7 @@ class TestFilterBySeverity:
         ]
 
     def test_filter_min_low_includes_all_except_informational(self):
-        result = self.scanner._filter_by_severity(self.issues, "Low")
+        result = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("Low"))
 
         # Low filter should include Low, Medium, High, Critical (exclude Informational)
         assert len(result) == 4
@@ -48,7 +65,7 @@ class TestFilterBySeverity:
         assert "Informational" not in severities
 
     def test_filter_min_medium_includes_medium_high_critical(self):
-        result = self.scanner._filter_by_severity(self.issues, "Medium")
+        result = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("Medium"))
 
         assert len(result) == 3
         severities = [i["severity"] for i in result]
@@ -57,7 +74,7 @@ class TestFilterBySeverity:
         assert "Critical" in severities
 
     def test_filter_min_high_includes_high_critical(self):
-        result = self.scanner._filter_by_severity(self.issues, "High")
+        result = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("High"))
 
         assert len(result) == 2
         severities = [i["severity"] for i in result]
@@ -65,15 +82,15 @@ class TestFilterBySeverity:
         assert "Critical" in severities
 
     def test_filter_min_critical_only_critical(self):
-        result = self.scanner._filter_by_severity(self.issues, "Critical")
+        result = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("Critical"))
 
         assert len(result) == 1
         assert result[0]["severity"] == "Critical"
 
     def test_filter_case_insensitive(self):
-        result_upper = self.scanner._filter_by_severity(self.issues, "HIGH")
-        result_lower = self.scanner._filter_by_severity(self.issues, "high")
-        result_mixed = self.scanner._filter_by_severity(self.issues, "High")
+        result_upper = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("HIGH"))
+        result_lower = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("high"))
+        result_mixed = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("High"))
 
         assert len(result_upper) == len(result_lower) == len(result_mixed) == 2
 
@@ -84,13 +101,40 @@ class TestFilterBySeverity:
         ]
 
         # min_severity "Low" (rank 1) should include unknown (defaults to rank 1)
-        result = self.scanner._filter_by_severity(issues, "Low")
+        result = self.scanner._filter_by_severity(issues, self.scanner._severity_threshold("Low"))
         # Unknown severity gets rank 1, Low is rank 1, so 1 >= 1 -> included
         assert len(result) == 1
 
     def test_filter_unknown_min_severity_defaults_to_low(self):
         # Unknown min_severity should default to Low (rank 1)
-        result = self.scanner._filter_by_severity(self.issues, "NotASeverity")
+        result = self.scanner._filter_by_severity(self.issues, self.scanner._severity_threshold("NotASeverity"))
 
         # Default to Low (rank 1) -> include all except Informational
         assert len(result) == 4
+
+
+class TestRawDataConverter:
+    """Test _raw_data_converter gating of raw tool findings."""
+
+    RAW_ISSUE = {"title": "Reentrancy", "severity": "High", "elements": [{"line": 20}]}
+
+    def test_raw_data_dropped_by_default(self):
+        convert = DummyScanner()._raw_data_converter(ScanConfig())
+
+        assert convert(self.RAW_ISSUE) is None
+
+    def test_raw_data_kept_when_configured(self):
+        convert = DummyScanner()._raw_data_converter(ScanConfig(keep_raw_issues=True))
+
+        assert orjson.loads(orjson.dumps(convert(self.RAW_ISSUE))) == self.RAW_ISSUE
+
+    def test_audit_config_scan_section_is_used(self):
+        convert = DummyScanner()._raw_data_converter(AuditConfig(scan=ScanConfig(keep_raw_issues=True)))
+
+        assert convert(self.RAW_ISSUE) is not None
+
+    def test_keep_raw_class_flag(self):
+        class RawScanner(DummyScanner):
+            KEEP_RAW = True
+
+        assert RawScanner()._raw_data_converter()(self.RAW_ISSUE) is not None
@@ -0,0 +1,389 @@
+"""
+Unit tests for SlitherScanner report handling and the source-digest report cache.
+"""
+from unittest.mock import patch
+
+import os
+import re
+from collections import OrderedDict
+
+import orjson
+import pytest
+
+from src.core.analysis import slither_scanner
+from src.core.analysis.base_scanner import SlitherExecutionError
+from src.core.analysis.slither_scanner import SlitherScanner
+from src.core.tools.run_tool import TIMEOUT_EXIT_CODE
+
+
+REPORT = orjson.dumps({
+    "success": True,
+    "results": {
+        "detectors": [
+            {
+                "check": "reentrancy-eth",
+                "impact": "High",
+                "confidence": "Medium",
+                "description": "Reentrancy in A.withdraw()",
+                "elements": [{"source_mapping": {"filename_relative": "src/A.sol", "lines": [12]}}],
+            }
+        ]
+    },
+})
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(slither_scanner, "SLITHER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(SlitherScanner, "_active_solc_version", None)
+    monkeypatch.setattr(slither_scanner.solc_select, "SOLC_SELECT_DIR", str(tmp_path / "solc-select"))
+    monkeypatch.setattr(SlitherScanner, "_result_cache", OrderedDict())
+    monkeypatch.setattr(slither_scanner, "_file_digests", OrderedDict())
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "A.sol").write_text("contract A {}")
+    return root
+
+
+def fake_run_tool(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+    if cmd[0] == "solc-select":
+        return 0, b"", b"", "solc.out", "solc.err"
+    return 0, REPORT, b"", "slither.out", "slither.err"
+
+
+def run_scanner(root):
+    with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+        issues, _ = SlitherScanner().run(str(root))
+    slither_calls = [c for c in run_tool.call_args_list if c.args[0][0] == "slither"]
+    return issues, len(slither_calls)
+
+
+class TestSlitherCache:
+    """Test the report cache keyed by project sources."""
+
+    def test_first_run_invokes_slither(self, repo):
+        issues, calls = run_scanner(repo)
+
+        assert calls == 1
+        assert [(i["type"], i["file"], i["line"]) for i in issues] == [("reentrancy-eth", "src/A.sol", 12)]
+
+    def test_unchanged_sources_reuse_report(self, repo):
+        first, _ = run_scanner(repo)
+        SlitherScanner.reset_result_cache()
+        second, calls = run_scanner(repo)
+
+        assert calls == 0
+        assert second == first
+
+    def test_changed_source_is_rescanned(self, repo):
+        run_scanner(repo)
+        (repo / "src" / "A.sol").write_text("contract A { uint x; }")
+        _, calls = run_scanner(repo)
+
+        assert calls == 1
+
+    def test_unchanged_file_stats_skip_rehashing(self, repo):
+        run_scanner(repo)
+        SlitherScanner.reset_result_cache()
+        source = repo / "src" / "A.sol"
+        st = source.stat()
+        # Same size and mtime: the stored file digest is trusted without reading the file
+        source.write_text("contract B {}")
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        _, calls = run_scanner(repo)
+
+        assert calls == 0
+
+    def test_large_cached_report_is_streamed(self, repo, monkeypatch):
+        first, _ = run_scanner(repo)
+        SlitherScanner.reset_result_cache()
+        monkeypatch.setattr(slither_scanner, "STREAM_THRESHOLD_BYTES", 0)
+
+        with patch.object(slither_scanner.orjson, "loads", side_effect=AssertionError("read whole report")):
+            second, calls = run_scanner(repo)
+
+        assert calls == 0
+        assert second == first
+
+    def test_corrupt_large_cached_report_is_discarded(self, repo, tmp_path, monkeypatch):
+        run_scanner(repo)
+        SlitherScanner.reset_result_cache()
+        (entry,) = (tmp_path / "cache").iterdir()
+        entry.write_bytes(REPORT[:-20])
+        monkeypatch.setattr(slither_scanner, "STREAM_THRESHOLD_BYTES", 0)
+
+        issues, calls = run_scanner(repo)
+
+        assert calls == 1
+        assert [i["type"] for i in issues] == ["reentrancy-eth"]
+        assert entry.read_bytes() == REPORT
+
+    def test_large_report_streamed_from_disk_and_cached(self, repo, tmp_path):
+        report_path = tmp_path / "slither.out"
+        report_path.write_bytes(REPORT)
+
+        def large_run_tool(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+            if cmd[0] == "slither":
+                return 0, None, b"", str(report_path), "slither.err"
+            return fake_run_tool(cmd, cwd, timeout)
+
+        with patch.object(slither_scanner, "run_tool", side_effect=large_run_tool):
+            first, _ = SlitherScanner().run(str(repo))
+        SlitherScanner.reset_result_cache()
+        second, calls = run_scanner(repo)
+
+        assert [i["type"] for i in first] == ["reentrancy-eth"]
+        assert calls == 0
+        assert second == first
+
+    def test_disk_cache_can_be_disabled(self, repo, tmp_path, monkeypatch):
+        monkeypatch.setattr(slither_scanner.disk_cache, "DISK_CACHE_ENABLED", False)
+        run_scanner(repo)
+        SlitherScanner.reset_result_cache()
+        _, calls = run_scanner(repo)
+
+        assert calls == 1
+        assert not (tmp_path / "cache").exists()
+
+    def test_failed_report_is_not_cached(self, repo):
+        failed = orjson.dumps({"success": False, "error": "compilation failed", "results": {}})
+        with patch.object(slither_scanner, "run_tool", return_value=(1, failed, b"", "o", "e")):
+            SlitherScanner().run(str(repo))
+
+        _, calls = run_scanner(repo)
+
+        assert calls == 1
+
+
+class TestSlitherResultCache:
+    """Test the in-memory cache of filtered results."""
+
+    def test_repeated_scan_served_from_memory(self, repo, tmp_path):
+        first, _ = run_scanner(repo)
+        (tmp_path / "cache").rename(tmp_path / "moved")
+        second, calls = run_scanner(repo)
+
+        assert calls == 0
+        assert second == first
+        assert second[0] is not first[0]
+
+    def test_severity_threshold_is_part_of_key(self, repo):
+        class HighOnly:
+            def get_min_severity(self):
+                return "High"
+
+        run_scanner(repo)
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool), \
+                patch.object(slither_scanner.orjson, "loads", wraps=orjson.loads) as loads:
+            SlitherScanner().run(str(repo), config=HighOnly())
+
+        loads.assert_called()
+
+    def test_cache_is_bounded(self, repo, monkeypatch):
+        monkeypatch.setattr(slither_scanner, "RESULT_CACHE_SIZE", 1)
+        run_scanner(repo)
+        (repo / "src" / "A.sol").write_text("contract A { uint x; }")
+        run_scanner(repo)
+
+        assert len(SlitherScanner._result_cache) == 1
+
+
+class TestSlitherIssueShaping:
+    """Test conversion of Slither detectors to issues."""
+
+    def test_detectors_filtered_and_normalized(self, repo):
+        report = orjson.dumps({"success": True, "results": {"detectors": [
+            {"check": "suicidal", "impact": "HIGH", "confidence": "high", "elements": []},
+            {"check": "naming-convention", "impact": "Informational", "elements": []},
+            {"check": "solc-version", "impact": "Optimization", "elements": []},
+        ]}})
+        with patch.object(slither_scanner, "run_tool", return_value=(0, report, b"", "o", "e")):
+            issues, _ = SlitherScanner().run(str(repo))
+
+        assert [(i["type"], i["severity"], i["confidence"], i["file"], i["line"]) for i in issues] == [
+            ("suicidal", "High", "High", "Unknown", 0)
+        ]
+
+
+class TestSlitherPerFile:
+    """Test per-file execution for differential scans."""
+
+    def setup_files(self, repo):
+        (repo / "src" / "B.sol").write_text("contract B {}")
+        return [str(repo / "src" / "A.sol"), str(repo / "src" / "B.sol")]
+
+    def test_changed_files_scanned_separately_and_merged(self, repo):
+        files = self.setup_files(repo)
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            issues, log_paths = SlitherScanner().run(str(repo), files=files)
+
+        slither_targets = sorted(c.args[0][1] for c in run_tool.call_args_list if c.args[0][0] == "slither")
+        assert slither_targets == ["src/A.sol", "src/B.sol"]
+        # Both reports contain the same finding; it is only reported once
+        assert len(issues) == 1
+        assert log_paths == {"Slither": ["slither.out", "slither.err"] * 2}
+
+    def test_one_failing_file_keeps_other_results(self, repo):
+        files = self.setup_files(repo)
+
+        def flaky_run_tool(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+            if cmd[0] == "slither" and cmd[1] == "src/B.sol":
+                return 1, b"", b"compilation failed", "o", "e"
+            return fake_run_tool(cmd, cwd, timeout)
+
+        with patch.object(slither_scanner, "run_tool", side_effect=flaky_run_tool):
+            issues, _ = SlitherScanner().run(str(repo), files=files)
+
+        assert [i["file"] for i in issues] == ["src/A.sol"]
+
+    def test_malformed_large_report_keeps_other_results(self, repo, tmp_path):
+        files = self.setup_files(repo)
+        truncated = tmp_path / "slither-b.out"
+        truncated.write_bytes(REPORT[:-20])
+
+        def truncating_run_tool(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+            if cmd[0] == "slither" and cmd[1] == "src/B.sol":
+                return 0, None, b"", str(truncated), "e"
+            return fake_run_tool(cmd, cwd, timeout)
+
+        with patch.object(slither_scanner, "run_tool", side_effect=truncating_run_tool):
+            issues, _ = SlitherScanner().run(str(repo), files=files)
+
+        assert [i["file"] for i in issues] == ["src/A.sol"]
+        # Only A.sol's report was read through, so only it is cached
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_diff_scan_ignores_unhashable_tree(self, repo):
+        files = self.setup_files(repo)
+        (repo / "src" / "broken.sol").symlink_to(repo / "src" / "missing.sol")
+
+        with patch.object(slither_scanner, "_source_digest", wraps=slither_scanner._source_digest) as digest:
+            with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+                issues, _ = SlitherScanner().run(str(repo), files=files)
+
+        slither_calls = [c for c in run_tool.call_args_list if c.args[0][0] == "slither"]
+        assert len(slither_calls) == 2
+        assert len(issues) == 1
+        # Only the changed files and their imports are hashed
+        digest.assert_not_called()
+
+    def test_unchanged_import_closure_reuses_report(self, repo):
+        files = self.setup_files(repo)
+        (repo / "src" / "Base.sol").write_text("contract Base {}")
+        (repo / "src" / "A.sol").write_text('import "./Base.sol";\ncontract A is Base {}')
+
+        def scan():
+            SlitherScanner.reset_result_cache()
+            with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+                SlitherScanner().run(str(repo), files=files)
+            return sorted(c.args[0][1] for c in run_tool.call_args_list if c.args[0][0] == "slither")
+
+        scan()
+        (repo / "src" / "Unrelated.sol").write_text("contract U {}")
+        assert scan() == []
+        (repo / "src" / "Base.sol").write_text("contract Base { uint x; }")
+        assert scan() == ["src/A.sol"]
+
+
+class TestSlitherTimeout:
+    """Test handling of slither runs killed by the timeout."""
+
+    def test_timeout_raises_execution_error(self, repo):
+        def hung_run_tool(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+            if cmd[0] == "slither":
+                return TIMEOUT_EXIT_CODE, b"", b"timed out", "o", "e"
+            return fake_run_tool(cmd, cwd, timeout)
+
+        with patch.object(slither_scanner, "run_tool", side_effect=hung_run_tool) as run_tool:
+            with pytest.raises(SlitherExecutionError, match="Timed out"):
+                SlitherScanner().run(str(repo))
+
+        slither_call = run_tool.call_args_list[-1]
+        assert slither_call.kwargs["timeout"] == slither_scanner.SLITHER_TIMEOUT
+
+
+class TestSlitherFileFilter:
+    """Test filtering of changed files before Slither runs."""
+
+    def test_no_solidity_changes_skip_scan(self, repo):
+        (repo / "README.md").write_text("docs")
+        (repo / "lib" / "forge-std").mkdir(parents=True)
+        (repo / "lib" / "forge-std" / "Test.sol").write_text("contract T {}")
+        files = [str(repo / "README.md"), str(repo / "lib" / "forge-std" / "Test.sol"), str(repo / "src" / "Gone.sol")]
+
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            result = SlitherScanner().run(str(repo), files=files)
+
+        assert result == ([], {})
+        run_tool.assert_not_called()
+
+
+    def test_excluded_dirs_passed_as_filter_paths(self, repo):
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            SlitherScanner().run(str(repo))
+
+        cmd = run_tool.call_args_list[-1].args[0]
+        pattern = re.compile(cmd[cmd.index("--filter-paths") + 1])
+        assert pattern.search("/repo/lib/forge-std/src/Test.sol")
+        assert pattern.search("node_modules/@openzeppelin/ERC20.sol")
+        assert not pattern.search("/repo/contracts/library/Math.sol")
+
+
+    def test_missing_changed_files_are_skipped(self, repo):
+        (repo / "src" / "B.sol").write_text("contract B {}")
+        files = [str(repo / "src" / "A.sol"), str(repo / "src" / "B.sol"), str(repo / "src" / "Gone.sol")]
+
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            SlitherScanner().run(str(repo), files=files)
+
+        slither_targets = sorted(c.args[0][1] for c in run_tool.call_args_list if c.args[0][0] == "slither")
+        assert slither_targets == ["src/A.sol", "src/B.sol"]
+
+    def test_relative_changed_files_are_resolved(self, repo, monkeypatch):
+        monkeypatch.chdir(repo.parent)
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            SlitherScanner().run("repo", files=[str(repo / "src" / "A.sol")])
+
+        assert run_tool.call_args_list[-1].args[0][1] == "src/A.sol"
+
+
+class TestSolcSelect:
+    """Test that solc-select only runs once per process."""
+
+    def test_solc_version_selected_once(self, repo):
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            SlitherScanner().run(str(repo))
+            (repo / "src" / "A.sol").write_text("contract A { uint x; }")
+            SlitherScanner().run(str(repo))
+
+        commands = [c.args[0][0] for c in run_tool.call_args_list]
+        assert commands == ["solc-select", "slither", "slither"]
+
+    def test_failed_selection_is_retried(self, repo):
+        def failing_solc_select(cmd, cwd=None, timeout=600, max_stdout_bytes=None):
+            if cmd[0] == "solc-select":
+                return 1, b"", b"not installed", "o", "e"
+            return fake_run_tool(cmd, cwd, timeout)
+
+        with patch.object(slither_scanner, "run_tool", side_effect=failing_solc_select) as run_tool:
+            SlitherScanner().run(str(repo))
+            (repo / "src" / "A.sol").write_text("contract A { uint x; }")
+            SlitherScanner().run(str(repo))
+
+        commands = [c.args[0][0] for c in run_tool.call_args_list]
+        assert commands.count("solc-select") == 2
+
+    def test_installed_version_selected_without_cli(self, repo, tmp_path):
+        solc_select_dir = tmp_path / "solc-select"
+        version = slither_scanner.SOLC_VERSION
+        artifact_dir = solc_select_dir / "artifacts" / f"solc-{version}"
+        artifact_dir.mkdir(parents=True)
+        (artifact_dir / f"solc-{version}").write_text("")
+        (solc_select_dir / "global-version").write_text("0.7.6")
+
+        with patch.object(slither_scanner, "run_tool", side_effect=fake_run_tool) as run_tool:
+            SlitherScanner().run(str(repo))
+
+        assert [c.args[0][0] for c in run_tool.call_args_list] == ["slither"]
+        assert (solc_select_dir / "global-version").read_text() == version
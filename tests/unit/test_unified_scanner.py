@@ -0,0 +1,93 @@
+"""
+Unit tests for UnifiedScanner concurrent execution and result merging.
+"""
+import threading
+
+from src.core.analysis.base_scanner import BaseScanner, SlitherExecutionError
+from src.core.analysis.unified_scanner import UnifiedScanner
+
+
+def make_issue(tool):
+    return {"tool": tool, "type": "reentrancy", "file": "src/A.sol", "line": 10, "severity": "High"}
+
+
+class StubScanner(BaseScanner):
+    """Scanner double that waits on a barrier so the test fails unless all stubs run at once."""
+
+    def __init__(self, name, barrier, issues=None, error=None):
+        self.TOOL_NAME = name
+        self.barrier = barrier
+        self.issues = issues or []
+        self.error = error
+
+    def run(self, target_path, files=None, config=None):
+        self.barrier.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return self.issues, {self.TOOL_NAME: [f"/tmp/{self.TOOL_NAME}.log"]}
+
+
+def run_unified(stubs):
+    scanner = UnifiedScanner()
+    scanner._get_enabled_scanners = lambda config=None: stubs
+    return scanner, scanner.run("/repo")
+
+
+class TestUnifiedRun:
+    """Test UnifiedScanner.run concurrency and merging."""
+
+    def test_scanners_run_concurrently(self):
+        barrier = threading.Barrier(2)
+        stubs = [
+            StubScanner("Slither", barrier, [make_issue("Slither")]),
+            StubScanner("Aderyn", barrier, [{**make_issue("Aderyn"), "line": 20}]),
+        ]
+
+        issues, log_paths = run_unified(stubs)[1]
+
+        assert [i["tool"] for i in issues] == ["Slither", "Aderyn"]
+        assert set(log_paths) == {"Slither", "Aderyn"}
+
+    def test_duplicate_findings_within_a_tool_are_merged(self):
+        barrier = threading.Barrier(2)
+        stubs = [
+            StubScanner("Slither", barrier, [make_issue("Slither"), make_issue("Slither")]),
+            StubScanner("Mythril", barrier, [make_issue("Mythril")]),
+        ]
+
+        issues, _ = run_unified(stubs)[1]
+
+        assert [i["tool"] for i in issues] == ["Slither", "Mythril"]
+
+    def test_duplicate_findings_with_list_lines_are_merged(self):
+        barrier = threading.Barrier(1)
+        issue = {**make_issue("Slither"), "line": [10, 11]}
+        stubs = [StubScanner("Slither", barrier, [issue, dict(issue)])]
+
+        issues, _ = run_unified(stubs)[1]
+
+        assert len(issues) == 1
+
+    def test_failed_scanner_does_not_stop_others(self):
+        barrier = threading.Barrier(2)
+        stubs = [
+            StubScanner("Slither", barrier, error=SlitherExecutionError("boom")),
+            StubScanner("Aderyn", barrier, [make_issue("Aderyn")]),
+        ]
+
+        scanner, (issues, _) = run_unified(stubs)
+
+        assert [i["tool"] for i in issues] == ["Aderyn"]
+        assert scanner.get_scan_stats()["tool_status"]["Slither"] == "❌ Failed"
+
+
+class TestIssueFingerprint:
+    """Test BaseScanner.get_issue_fingerprint."""
+
+    def test_fingerprint_format(self):
+        assert BaseScanner.get_issue_fingerprint(make_issue("Slither")) == "Slither|reentrancy|src/A.sol|10"
+
+    def test_unhashable_line_falls_back(self):
+        issue = {**make_issue("Aderyn"), "line": [10, 11]}
+
+        assert BaseScanner.get_issue_fingerprint(issue) == "Aderyn|reentrancy|src/A.sol|[10, 11]"
@@ -0,0 +1,114 @@
+"""
+Unit tests for the GitHub webhook endpoint: signature verification and task dispatch.
+"""
+import hashlib
+import hmac
+import os
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+
+class TestVerifySignature:
+    """Tests for verify_signature on /webhook/github."""
+
+    @pytest.fixture
+    def test_client(self):
+        """Create FastAPI test client."""
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        return TestClient(app)
+
+    @pytest.fixture
+    def body(self):
+        # A PR action that is skipped after verification, so no task is dispatched
+        return orjson.dumps({"action": "closed"})
+
+    def _sign(self, body: bytes) -> str:
+        from src.api.routers.github import _SECRET_BYTES
+        return "sha256=" + hmac.new(_SECRET_BYTES, body, hashlib.sha256).hexdigest()
+
+    def test_valid_signature_accepted(self, test_client, body):
+        response = test_client.post(
+            "/webhook/github",
+            content=body,
+            headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": self._sign(body)},
+        )
+        assert response.status_code == 200
+        assert "skipped" in response.json()["message"]
+
+    def test_invalid_signature_rejected(self, test_client, body):
+        response = test_client.post(
+            "/webhook/github",
+            content=body,
+            headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": "sha256=" + "0" * 64},
+        )
+        assert response.status_code == 401
+
+    def test_tampered_body_rejected(self, test_client, body):
+        signature = self._sign(body)
+        response = test_client.post(
+            "/webhook/github",
+            content=body + b" ",
+            headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": signature},
+        )
+        assert response.status_code == 401
+
+    def test_ignored_event_skips_verification(self, test_client, body):
+        # Non pull_request events are acknowledged before the body is verified
+        response = test_client.post(
+            "/webhook/github",
+            content=body,
+            headers={"X-GitHub-Event": "push", "X-Hub-Signature-256": "sha256=" + "0" * 64},
+        )
+        assert response.status_code == 204
+
+
+class TestWebhookDispatch:
+    """Tests for pull_request payload parsing and scan task dispatch."""
+
+    @pytest.fixture
+    def test_client(self):
+        """Create FastAPI test client."""
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        return TestClient(app)
+
+    @pytest.fixture
+    def pr_payload(self):
+        fixture = os.path.join(os.path.dirname(__file__), "..", "fixtures", "pr_payload.json")
+        with open(fixture, "rb") as f:
+            return f.read()
+
+    def test_pr_event_dispatches_scan(self, test_client, pr_payload):
+        with patch("src.api.routers.github.scan_repo_task") as mock_task:
+            mock_task.delay.return_value = "task-1"
+            response = test_client.post(
+                "/webhook/github", content=pr_payload, headers={"X-GitHub-Event": "pull_request"}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["task_id"] == "task-1"
+        repo_url, pr_context = mock_task.delay.call_args[0]
+        # Markdown-wrapped clone URL is unwrapped
+        assert repo_url == "https://github.com/athanase-matabaro/audit-pit-crew.git"
+        assert pr_context["installation_id"] == 96668963
+        assert pr_context["owner"] == "athanase-matabaro"
+
+    def test_missing_section_returns_400(self, test_client):
+        body = orjson.dumps({"action": "opened", "repository": None})
+        with patch("src.api.routers.github.scan_repo_task") as mock_task:
+            response = test_client.post(
+                "/webhook/github", content=body, headers={"X-GitHub-Event": "pull_request"}
+            )
+
+        assert response.status_code == 400
+        assert "Missing key 'repository'" in response.json()["detail"]
+        mock_task.delay.assert_not_called()
+
+    def test_malformed_json_returns_400(self, test_client):
+        response = test_client.post(
+            "/webhook/github", content=b"{not json", headers={"X-GitHub-Event": "pull_request"}
+        )
+        assert response.status_code == 400